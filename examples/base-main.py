@@ -1,5 +1,6 @@
 """Main file for showcasing the database structure using DBForge"""
 from fastapi import APIRouter, FastAPI
+from collections import defaultdict
 import os
 
 # Import our enhanced DBForge and related classes
@@ -42,7 +43,9 @@ db_manager = DBForge(config=DBConfig(
         pool_pre_ping=True
     ),
 ))
-db_manager.log_metadata_stats()
+VERBOSE = bool(os.getenv('FORGE_VERBOSE'))  # * Gate the startup pretty-printing
+if VERBOSE:
+    db_manager.log_metadata_stats()
 app.include_router(get_metadata_router(db_manager.metadata))  # * add the metadata router
 
 # ? Model Forge ---------------------------------------------------------------------------------
@@ -61,41 +64,40 @@ model_forge = ModelForge(
 # model_forge.log_schema_views()
 # todo: FnForge::log_schema_functions()
 
-# * Add some logging to the model_forge...
-# [print(f"{bold('Models:')} {table}") for table in model_forge.model_cache]
-# [print(f"{bold('Views:')} {view}") for view in model_forge.view_cache]
-# [print(f"{bold('PyEnum:')} {enum}") for enum in model_forge.enum_cache]
+# * Add some logging to the model_forge... (see log_metadata_stats above)
 # todo: Print the 'Functions' as well
-# [print(f"{bold('Functions:')} {enum}") for enum in model_forge.fn_cache]
-
 
 # ? Function Forge -----------------------------------------------------------------------------
 function_forge = FnForge(
     db_dependency=db_manager.get_db,
-    include_schemas=model_forge.include_schemas  # Reuse same schemas
+    include_schemas=model_forge.include_schemas,  # Reuse same schemas
+    engine=db_manager.engine,  # Direct sessions for the discovery pass
 )
-# Discover and set up functions
-function_forge.discover_functions()
-function_forge.generate_function_models()
+fn_router = APIRouter()
+# Discover functions, generate their models and register routes in one pass
+function_forge.build(fn_router)
 
 # todo: Add this to the FnForge class
 # todo: FnForge::log_schema_functions()
-function_forge.log_metadata_stats()
+if VERBOSE:
+    function_forge.log_metadata_stats()
 
-print(f"\n{bold('Functions:')} {len(function_forge.function_cache)}")
-for schema in model_forge.include_schemas:
-    print(f"\n{bold('\t')} {schema}")
+    print(f"\n{bold('Functions:')} {len(function_forge.function_cache)}")
+    # * Bucket the cache once (O(functions)) instead of scanning it per schema
+    functions_by_schema = defaultdict(list)
     for key, value in function_forge.function_cache.items():
-        if key.startswith(schema):
+        schema, fn_name = key.split('.', 1)
+        functions_by_schema[schema].append((fn_name, value))
+
+    for schema in model_forge.include_schemas:
+        print(f"\n{bold('\t')} {schema}")
+        for fn_name, value in functions_by_schema.get(schema, ()):
             # Add object_type to the output
-            print(f"\t\t{dim(f'{value.object_type.value:>10}')} {dim(f'{value.type.name:>16}')} {key.split('.')[1]}")
+            print(f"\t\t{dim(f'{value.object_type.value:>10}')} {dim(f'{value.type.name:>16}')} {fn_name}")
             for param in value.parameters:
                 print(f"\t\t\t\t\t{param.name} {param.type}")
             print()
 
-fn_router = APIRouter()
-
-function_forge.generate_function_routes(fn_router)
 app.include_router(fn_router)
 
 
@@ -106,7 +108,7 @@ api_forge = APIForge(model_forge=model_forge)
 # # * THE ROUTES MUST BE GENERATED AFTER THE MODELS!
 # api_forge.gen_table_routes()
 # api_forge.gen_view_routes()
-# * Print the routers
-[app.include_router(router) for router in api_forge.routers.values()]
+# * Attach every generated route in one flat pass (avoids include_router's per-router route copies)
+api_forge.finalize(app)
 
 print(f"\n\n{bold(app_config.PROJECT_NAME)} on {underline(italic(bold(green("http://localhost:8000/docs"))))}\n\n")
@@ -22,6 +22,7 @@ setup(
         "sqlalchemy>=2.0.30",
         "pydantic>=2.7.1",
         "psycopg2>=2.9.3",
+        "orjson>=3.10.0",
     ],
 
     extras_require={  # Add development dependencies (extras_require)
@@ -2,14 +2,13 @@
 APIForge: Enhanced API route generation with proper model handling.
 Integrates with ModelForge for model management and route generation.
 """
-from typing import Dict, List, Optional
+from typing import Dict, List
 from enum import Enum
-# import session
-from sqlalchemy.orm import Session
-from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy import Table, text
-from pydantic.main import create_model
+from dataclasses import dataclass, field
+import sys
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Table
 
 from forge.gen.view import generate_view_routes
 from forge.utils import *
@@ -17,6 +16,10 @@ from forge.model import ModelForge
 from forge.gen.crud import CRUD
 # from forge.gen.view import register_view_routes
 
+# * Color-wrapped constants (avoid re-running the ANSI lambdas per table/view)
+_GEN_CRUD_FOR = gray('gen crud for:')
+_GEN_VIEW_FOR = gray('gen view for:')
+
 class RouteType(str, Enum):
     """Available route types."""
     CREATE = "create"
@@ -24,28 +27,77 @@ class RouteType(str, Enum):
     UPDATE = "update"
     DELETE = "delete"
 
-class APIForge(BaseModel):
+# * Slotted dataclass instead of BaseModel: nothing here needs validation and
+# * the routers dict would otherwise drag pydantic through arbitrary types.
+@dataclass(slots=True)
+class APIForge:
     """
     Manages API route generation and CRUD operations.
     Works in conjunction with ModelForge for model handling.
     """
     model_forge: ModelForge  # * ModelForge instance for model management
-    routers: Dict[str, APIRouter] = Field(default_factory=dict)
+    routers: Dict[str, APIRouter] = field(default_factory=dict, init=False)
+    verbose: bool = False  # * Buffered generation log; silent by default
+
+    _log_lines: List[str] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self):
+        self.build_routers()
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    def build_routers(self) -> None:
+        """Create one table router per schema.
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # * Initialize the routers for each schema
+        View routers are created on demand in `_views_router`, so schemas
+        without views never pay for an unused APIRouter.
+        """
         for schema in sorted(self.model_forge.include_schemas):
-            self.routers[schema] = APIRouter(prefix=f"/{schema}", tags=[schema.upper()])
-            self.routers[f"{schema}_views"] = APIRouter(prefix=f"/{schema}", tags=[f"{schema.upper()} Views"])
+            self.routers[schema] = APIRouter(
+                prefix=f"/{schema}", tags=[schema.upper()],
+                default_response_class=ORJSONResponse,  # * orjson beats json.dumps on these payloads
+            )
+
+    def _views_router(self, schema: str) -> APIRouter:
+        """Get-or-create the views router for a schema."""
+        key = f"{schema}_views"
+        router = self.routers.get(key)
+        if router is None:
+            router = self.routers[key] = APIRouter(
+                prefix=f"/{schema}", tags=[f"{schema.upper()} Views"],
+                default_response_class=ORJSONResponse,
+            )
+        return router
+
+    def finalize(self, app: FastAPI) -> None:
+        """Attach all generated routes to the app in a single flat pass.
+
+        `app.include_router` re-copies every APIRoute (and re-runs its costly
+        __init__) once per inclusion, so calling it per schema scales badly.
+        Instead, extend the app's router with the already-built routes and
+        rebuild the middleware stack exactly once.
+        """
+        flat_router = APIRouter()
+        for router in self.routers.values():
+            flat_router.routes.extend(router.routes)
+        # * Reuse the app as the dependency overrides provider (same as include_router)
+        flat_router.dependency_overrides_provider = app
+        app.router.routes.extend(flat_router.routes)
+        app.middleware_stack = app.build_middleware_stack()
+
+    def _flush_log(self, header_line: str) -> None:
+        """Emit the buffered generation log as one stdout write (verbose only)."""
+        if self.verbose and self._log_lines:
+            sys.stdout.write(f"\n{bold(header_line)}\n" + "\n".join(self._log_lines) + "\n")
+        self._log_lines.clear()
 
     def gen_table_routes(self) -> None:
         """Generate CRUD routes for all tables in the model cache."""
-        print(f"\n{bold('[Generating Routes]')}")
-        for table in self.model_forge.model_cache.keys():
-            self.gen_table_crud(*table.split("."))
+        # * Resolve (schema, name) from the DB name index: one dict probe per
+        # * table instead of allocating a split('.') list per key.
+        name_index = self.model_forge.db_manager.table_names
+        for full_name in self.model_forge.model_cache.keys():
+            schema, table_name, _ = name_index[full_name]
+            self.gen_table_crud(schema, table_name)
+        self._flush_log('[Generating Routes]')
 
     def gen_table_crud(self, schema: str,  table_name: str) -> None:
         """Generate the curd routes for a certain Table..."""
@@ -60,30 +112,34 @@ class APIForge(BaseModel):
             sqlalchemy_model=sqlalchemy_model,
             router=self.routers[schema],
             db_dependency=self.model_forge.db_manager.get_db,
-            tags=[schema.upper()]
+            tags=self.routers[schema].tags  # * Reuse the schema's tags list, no per-table copy
         ).generate_all()
 
-        print(f"\t{gray('gen crud for:')} {schema}.{bold(cyan(table_name))}")
+        if self.verbose:
+            self._log_lines.append(f"\t{_GEN_CRUD_FOR} {schema}.{bold(cyan(table_name))}")
 
     def gen_view_routes(self) -> None:
         """Generate routes for all views in the view cache."""
-        print(f"\n{bold('[Generating View Routes]')}")
         for view_name, view_table in self.model_forge.view_cache.items():
             self.gen_view_route(view_name, view_table)
+        self._flush_log('[Generating View Routes]')
 
     def gen_view_route(self, view_name: str, view_table: Table) -> None:
         """Generate the GET route for a View with proper array type handling."""
         schema = view_table.schema
-        print(f"\t{gray('gen view for:')} {schema}.{bold(cyan(view_name))}")
+        if self.verbose:
+            self._log_lines.append(f"\t{_GEN_VIEW_FOR} {schema}.{bold(cyan(view_name))}")
         try:
+            views_router = self._views_router(schema)
             generate_view_routes(
                 view_table=view_table,
                 schema=schema,
                 # TODO: Decide on a better way to handle this... (maybe a config?)
                 # router=self.routers[schema],
-                router=self.routers[f"{schema}_views"],  # * Use the views router
+                router=views_router,  # * Use the (lazily created) views router
                 db_dependency=self.model_forge.db_manager.get_db,
-                get_eq_type=get_eq_type
+                get_eq_type=get_eq_type,
+                engine=self.model_forge.db_manager.engine  # * direct session for the sample probe
             )
         except Exception as e:
             print(f"\t{red(f'Error generating view route for {view_name}: {str(e)}')}")
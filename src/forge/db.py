@@ -1,14 +1,33 @@
 from sqlalchemy import CursorResult, Inspector, MetaData, Table, inspect, text, Index
 from sqlalchemy.engine import Engine, create_engine
-from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
-from sqlalchemy.ext.automap import automap_base
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Dict, Generator, List, Optional, Any, Type, Union, Set, Tuple
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import AsyncGenerator, Dict, Generator, List, Optional, Any, Type, Union, Set, Tuple
 from enum import Enum
+from collections import ChainMap
+from dataclasses import dataclass, field
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from pathlib import Path
+import hashlib
+import pickle
+import threading
 from forge.utils import *
 
 
+# * ANSI codes as plain constants: log lines interpolate them directly instead
+# * of paying a lambda call + two string concatenations per styled fragment.
+_BOLD = '\033[1m'
+_ITALIC = '\033[3m'
+_GRAY = '\033[90m'
+_GREEN = '\033[32m'
+_YELLOW = '\033[33m'
+_RED = '\033[31m'
+_RESET = '\033[0m'
+
+
 class DBType(str, Enum):
     """Supported database types."""
     SQLITE = "sqlite"
@@ -55,67 +74,118 @@ class DBConfig(BaseModel):
     schema_exclude: List[str] = Field(default=["information_schema", "pg_catalog"])
     ssl_mode: Optional[str] = None  # * idk if this is the right place for this
 
-    model_config = ConfigDict(use_enum_values=True)
+    # * Coerce str -> enum exactly once, during validation (no __init__ re-coercion)
+    @field_validator('db_type')
+    @classmethod
+    def _coerce_db_type(cls, v: Union[DBType, str]) -> DBType:
+        return DBType(v) if isinstance(v, str) else v
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self.db_type = DBType(self.db_type) if isinstance(self.db_type, str) else self.db_type
-        self.driver_type = DriverType(self.driver_type) if isinstance(self.driver_type, str) else self.driver_type
+    @field_validator('driver_type')
+    @classmethod
+    def _coerce_driver_type(cls, v: Union[DriverType, str]) -> DriverType:
+        return DriverType(v) if isinstance(v, str) else v
 
-    @property
+    @cached_property
     def url(self) -> str:
+        """Database URL (built on first access, then a plain attribute read)."""
+        return self._build_url()
+
+    @cached_property
+    def sync_url(self) -> str:
+        """URL forced onto the sync driver (reflection/introspection path)."""
+        return self._build_url(DriverType.SYNC)
+
+    def _build_url(self, driver_type: Optional[DriverType] = None) -> str:
         """Generate database URL based on configuration."""
         if self.db_type == DBType.SQLITE:
             return f"sqlite:///{self.database}"
-        
+
         if self.db_type in (DBType.POSTGRESQL, DBType.MYSQL, DBType.MSSQL):
             if not all([self.user, self.password, self.host]):
                 raise ValueError(f"Incomplete configuration for {self.db_type}")
-            
+
             dialect = self.db_type.value
-            driver = self._get_driver()
-            
+            driver = self._get_driver(driver_type)
+
             port_str = f":{self.port}" if self.port is not None else ""
             ssl_str = f"?sslmode={self.ssl_mode}" if self.ssl_mode else ""
-            
+
             return f"{dialect}{driver}://{self.user}:{self.password}@{self.host}{port_str}/{self.database}{ssl_str}"
-        
+
         raise ValueError(f"Unsupported database type: {self.db_type}")
 
-    def _get_driver(self) -> str:
+    def _get_driver(self, driver_type: Optional[DriverType] = None) -> str:
         """Get appropriate database driver based on configuration."""
+        driver_type = driver_type or self.driver_type
         if self.db_type == DBType.POSTGRESQL:
-            return "+asyncpg" if self.driver_type == DriverType.ASYNC else "+psycopg2"
+            return "+asyncpg" if driver_type == DriverType.ASYNC else "+psycopg2"
         elif self.db_type == DBType.MYSQL:
-            return "+aiomysql" if self.driver_type == DriverType.ASYNC else "+pymysql"
+            return "+aiomysql" if driver_type == DriverType.ASYNC else "+pymysql"
         elif self.db_type == DBType.MSSQL:
-            return "+pytds" if self.driver_type == DriverType.ASYNC else "+pyodbc"
+            return "+pytds" if driver_type == DriverType.ASYNC else "+pyodbc"
         return ""
 
 
-class DBForge(BaseModel):
+# * A plain slotted dataclass: Engine/MetaData/sessionmaker gain nothing from
+# * pydantic validation, and skipping the core-schema walk trims startup cost.
+@dataclass(slots=True)
+class DBForge:
     """Enhanced database management with extended functionality."""
-    config: DBConfig = Field(...)
-    engine: Engine = Field(default=None)
-    metadata: MetaData = Field(default_factory=MetaData)
-    Base: Type[DeclarativeBase] = Field(default_factory=automap_base)
-    SessionLocal: sessionmaker = Field(default=None)
+    # * Pydantic still builds a core schema for this dataclass when it shows up
+    # * as a ModelForge field; pin a local config so ModelForge's extra='allow'
+    # * doesn't propagate here (init=False fields are rejected under 'allow').
+    # * arbitrary_types_allowed must come along: this config replaces, not
+    # * merges with, the enclosing model's.
+    __pydantic_config__ = ConfigDict(extra='ignore', arbitrary_types_allowed=True)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    config: DBConfig
+    engine: Engine = field(default=None, init=False)
+    metadata: MetaData = field(default_factory=MetaData, init=False)
+    SessionLocal: sessionmaker = field(default=None, init=False)
+    table_names: Dict[str, Tuple[str, str, bool]] = field(default_factory=dict, init=False)  # * full_name -> (schema, name, is_view)
+    async_engine: Optional[AsyncEngine] = field(default=None, init=False)
+    AsyncSessionLocal: Optional[async_sessionmaker] = field(default=None, init=False)
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    _reflected: Set[str] = field(default_factory=set, init=False, repr=False)
+    _tables_by_schema: Dict[str, Dict[str, Table]] = field(default_factory=dict, init=False, repr=False)
+    _views_by_schema: Dict[str, Dict[str, Table]] = field(default_factory=dict, init=False, repr=False)
+    _all_tables: Optional[ChainMap] = field(default=None, init=False, repr=False)
+    _all_views: Optional[ChainMap] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
         self.engine = self._create_engine()
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # * expire_on_commit=False: committed instances keep their loaded state,
+        # * so handlers don't pay a reload round-trip after every commit
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
+        if self.config.driver_type == DriverType.ASYNC:
+            # * Request handlers get a real async engine/session; reflection and
+            # * other startup introspection stay on the sync engine above.
+            pool_kwargs = self.config.pool_config.model_dump() if self.config.pool_config else {}
+            self.async_engine = create_async_engine(self.config.url, echo=self.config.echo, query_cache_size=2000, **pool_kwargs)
+            self.AsyncSessionLocal = async_sessionmaker(self.async_engine, expire_on_commit=False)
         # self._test_connection()  # * Uncomment to test connection on initialization
-        self._load_metadata()
+
+        if self._load_metadata_cached():
+            # * Serve the (possibly stale) cache now, revalidate in the background
+            threading.Thread(target=self._revalidate_metadata_cache, daemon=True).start()
+        else:
+            self._load_metadata()
 
     def _create_engine(self) -> Engine:
-        """Create SQLAlchemy engine with connection pooling."""
+        """Create SQLAlchemy engine with connection pooling.
+
+        Every PoolConfig knob (pool_size, max_overflow, pool_timeout,
+        pool_recycle, pool_pre_ping) is forwarded to create_engine; a missing
+        pool_config falls back to SQLAlchemy's defaults.
+        """
         pool_kwargs = self.config.pool_config.model_dump() if self.config.pool_config else {}
         return create_engine(
-            self.config.url,
+            self.config.sync_url,  # * Always the sync driver; async handlers use async_engine
             echo=self.config.echo,  # ^ Uncomment for verbose logging
+            # * The generated routes emit a handful of statement shapes per
+            # * table; size the compiled-SQL cache so wide schemas don't evict
+            # * each other's entries (default is 500)
+            query_cache_size=2000,
             **pool_kwargs
         )
 
@@ -123,33 +193,195 @@ class DBForge(BaseModel):
         """Test database connection and log connection info."""
         try:
             user, database = self.exec_raw_sql("SELECT current_user, current_database()").fetchone()
-            print(f"\n{gray('Connected to')} {bold(database)} {gray('as')} {bold(user)}")
-            print(f"{green('Database connection test successful!')}")
+            print(f"\n{_GRAY}Connected to{_RESET} {_BOLD}{database}{_RESET} {_GRAY}as{_RESET} {_BOLD}{user}{_RESET}")
+            print(f"{_GREEN}Database connection test successful!{_RESET}")
         except Exception as e:
-            print(f"{red('Database connection test failed:')} {str(e)}")
+            print(f"{_RED}Database connection test failed:{_RESET} {str(e)}")
             raise
         print()
 
     def _load_metadata(self) -> None:
-        """Enhanced metadata loading with schema filtering and error handling."""
-        inspector: Inspector = inspect(self.engine)
-        
-        # Create our base declarative base class first
-        class Base(DeclarativeBase):
-            pass
-        
-        self.Base = Base  # Store the actual base class, not the DeclarativeBase
+        """Load a lightweight name index only; per-table reflection is deferred.
+
+        Startup fetches just the table/view names per schema (O(schemas) round
+        trips). The expensive `Table(..., autoload_with=...)` reflection happens
+        lazily on first access through `get_table`/`get_view`.
+        """
+        self.table_names = self._build_name_index()
 
-        # Load tables and views into metadata
+    def _build_name_index(self) -> Dict[str, Tuple[str, str, bool]]:
+        """Build the {full_name: (schema, name, is_view)} index from the live DB."""
         # # todo: Change this to filter the schemas depending on...
         # # todo: User permissions or configuration settings...
         # # * To enable some kind of MULTI-TENANCY support
-        for schema in sorted(set(inspector.get_schema_names()) - set(self.config.schema_exclude)):
-            [Table(t, self.metadata, autoload_with=self.engine, schema=schema) for t in inspector.get_table_names(schema=schema)]
-            [Table(v, self.metadata, autoload_with=self.engine, schema=schema) for v in inspector.get_view_names(schema=schema)]
+        index: Dict[str, Tuple[str, str, bool]] = {}
+        match self.config.db_type:
+            case DBType.SQLITE:  # * No information_schema: fall back to the inspector
+                # One connection for every inspector query instead of a checkout each
+                with self.engine.connect() as conn:
+                    inspector: Inspector = inspect(conn)
+                    for schema in sorted(set(inspector.get_schema_names()) - set(self.config.schema_exclude)):
+                        for table_name in inspector.get_table_names(schema=schema):
+                            index[f"{schema}.{table_name}"] = (schema, table_name, False)
+                        for view_name in inspector.get_view_names(schema=schema):
+                            index[f"{schema}.{view_name}"] = (schema, view_name, True)
+            case _:  # * One round-trip for every schema instead of 2 inspector calls each
+                # * Excluded schemas travel as one bound array (<> ALL), same as
+                # * the function-discovery SQL: safe against quoting in schema
+                # * names and still valid when the exclude list is empty
+                query = text(
+                    "SELECT table_schema, table_name, table_type "
+                    "FROM information_schema.tables "
+                    "WHERE table_schema <> ALL(:excluded) "
+                    "ORDER BY table_schema, table_name"
+                )
+                with self.engine.connect() as conn:
+                    rows = conn.execute(query, {"excluded": list(self.config.schema_exclude)}).all()
+                for schema, name, table_type in rows:
+                    index[f"{schema}.{name}"] = (schema, name, table_type == 'VIEW')
+        return index
 
+    # * ON-DISK METADATA CACHE (stale-while-revalidate)
 
-        # self.Base.prepare(self.engine, reflect=True)
+    def _cache_path(self) -> Path:
+        """Cache file keyed by the connection URL."""
+        return Path.home() / ".cache" / "crud_forge" / f"{hashlib.sha256(self.config.url.encode()).hexdigest()[:16]}.pkl"
+
+    @staticmethod
+    def _fingerprint(index: Dict[str, Tuple[str, str, bool]]) -> str:
+        """Cheap proxy for schema shape: a hash of the sorted name index."""
+        return hashlib.sha256(repr(sorted(index.items())).encode()).hexdigest()
+
+    def _load_metadata_cached(self) -> bool:
+        """Load metadata from the on-disk cache. Returns True on a hit."""
+        try:
+            with self._cache_path().open("rb") as f:
+                cached = pickle.load(f)
+            self.metadata = cached["metadata"]
+            self.table_names = cached["table_names"]
+            self._reflected = cached["reflected"]
+            return True
+        except Exception:
+            return False
+
+    def _save_metadata_cache(self) -> None:
+        """Persist reflected metadata (best effort — failures are ignored)."""
+        try:
+            path = self._cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("wb") as f:
+                pickle.dump({
+                    "metadata": self.metadata,
+                    "table_names": self.table_names,
+                    "reflected": self._reflected,
+                }, f)
+        except Exception:
+            pass
+
+    def _revalidate_metadata_cache(self) -> None:
+        """Compare the live name index against the cached one; refresh on drift.
+
+        Runs in a background thread so startup keeps serving the cached
+        metadata ('serve stale, refresh in background'); a failed
+        revalidation (e.g. DB unreachable) is tolerated.
+        """
+        try:
+            fresh_index = self._build_name_index()
+            if self._fingerprint(fresh_index) == self._fingerprint(self.table_names):
+                return
+            # * Schema drifted: drop the cache and start over from the live DB
+            self._cache_path().unlink(missing_ok=True)
+            self.metadata = MetaData()
+            self._reflected.clear()
+            self._tables_by_schema.clear()
+            self._views_by_schema.clear()
+            self._all_tables = None
+            self._all_views = None
+            self.table_names = fresh_index
+        except Exception:
+            pass
+
+    # * LAZY REFLECTION ACCESSORS
+
+    def is_view(self, full_name: str) -> bool:
+        """Check whether a 'schema.name' entry is a view (from the name index)."""
+        return self.table_names[full_name][2]
+
+    def get_table(self, schema: str, name: str) -> Table:
+        """Return a (lazily reflected) Table for 'schema.name'."""
+        full_name = f"{schema}.{name}"
+        # * Fast path: already materialized (one dict probe, no set lookup)
+        table = self.metadata.tables.get(full_name)
+        if table is not None:
+            return table
+        if full_name not in self.table_names:
+            raise KeyError(f"Unknown table or view: {full_name}")
+        with self.engine.connect() as conn:
+            Table(name, self.metadata, autoload_with=conn, schema=schema)
+        self._reflected.add(full_name)
+        return self.metadata.tables[full_name]
+
+    def get_view(self, schema: str, name: str) -> Table:
+        """Return a (lazily reflected) Table for a view 'schema.name'."""
+        return self.get_table(schema, name)
+
+    def _reflect_many(self, entries: List[Tuple[str, str]]) -> None:
+        """Reflect several tables concurrently over the connection pool.
+
+        Each autoload is a blocking round-trip that releases the GIL while
+        waiting on the DB, so a pool-sized thread pool gives real concurrency
+        (up to pool_size + max_overflow reflections in flight).
+        """
+        pending = [(s, n) for s, n in entries if f"{s}.{n}" not in self._reflected]
+        if not pending:
+            return
+        pool = self.config.pool_config or PoolConfig()
+        max_workers = min(len(pending), pool.pool_size + pool.max_overflow)
+
+        def reflect_chunk(chunk: List[Tuple[str, str]]) -> None:
+            # * One checkout (and one pool_pre_ping probe) per worker, not per table
+            with self.engine.connect() as conn:
+                for schema, name in chunk:
+                    Table(name, self.metadata, autoload_with=conn, schema=schema)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(reflect_chunk, (pending[i::max_workers] for i in range(max_workers))))
+        self._reflected.update(f"{s}.{n}" for s, n in pending)
+        self._save_metadata_cache()  # * Warm the on-disk cache for the next startup
+
+    def get_tables(self, schema: str) -> Dict[str, Table]:
+        """Return all base tables for a schema (materialized once, then memoized)."""
+        if schema not in self._tables_by_schema:
+            entries = [(s, name) for s, name, is_view in self.table_names.values() if s == schema and not is_view]
+            self._reflect_many(entries)
+            self._tables_by_schema[schema] = {name: self.metadata.tables[f"{schema}.{name}"] for _, name in entries}
+        return self._tables_by_schema[schema]
+
+    def get_views(self, schema: str) -> Dict[str, Table]:
+        """Return all views for a schema (materialized once, then memoized)."""
+        if schema not in self._views_by_schema:
+            entries = [(s, name) for s, name, is_view in self.table_names.values() if s == schema and is_view]
+            self._reflect_many(entries)
+            self._views_by_schema[schema] = {name: self.metadata.tables[f"{schema}.{name}"] for _, name in entries}
+        return self._views_by_schema[schema]
+
+    def get_all_tables(self) -> ChainMap:
+        """All base tables across schemas as a lazy ChainMap (built once).
+
+        Memoized in a slot rather than functools.cached_property because the
+        dataclass uses __slots__ (no instance __dict__ for the descriptor).
+        """
+        if self._all_tables is None:
+            schemas = sorted({s for s, _, is_view in self.table_names.values() if not is_view})
+            self._all_tables = ChainMap(*(self.get_tables(schema) for schema in schemas))
+        return self._all_tables
+
+    def get_all_views(self) -> ChainMap:
+        """All views across schemas as a lazy ChainMap (built once)."""
+        if self._all_views is None:
+            schemas = sorted({s for s, _, is_view in self.table_names.values() if is_view})
+            self._all_views = ChainMap(*(self.get_views(schema) for schema in schemas))
+        return self._all_views
 
     # * PUBLIC METHODS (OPERATIONS)
     @contextmanager
@@ -173,6 +405,13 @@ class DBForge(BaseModel):
         finally:
             db.close()
 
+    async def get_async_db(self) -> AsyncGenerator[AsyncSession, None]:
+        """Async session generator (FastAPI dependency); needs DriverType.ASYNC."""
+        if self.AsyncSessionLocal is None:
+            raise RuntimeError("Async sessions require DriverType.ASYNC in DBConfig")
+        async with self.AsyncSessionLocal() as session:
+            yield session
+
     def exec_raw_sql(self, query: str) -> CursorResult:
         """Execute raw SQL query."""
         with self.engine.connect() as connection: return connection.execute(text(query))
@@ -191,18 +430,25 @@ class DBForge(BaseModel):
         """Log metadata statistics."""
         user, database = self.exec_raw_sql("SELECT current_user, current_database()").fetchone()
 
-        print(f"{gray('Connected to')} {bold(database)} {gray('as')} {bold(user)}")
-        print(f"{gray('Database version:')} {bold(self.get_db_version())}")
+        print(f"{_GRAY}Connected to{_RESET} {_BOLD}{database}{_RESET} {_GRAY}as{_RESET} {_BOLD}{user}{_RESET}")
+        print(f"{_GRAY}Database version:{_RESET} {_BOLD}{self.get_db_version()}{_RESET}")
 
-        print(f"\n{bold('DB Connection Information:')}")
-        print(f"\t{f"Type:":<12}{green(self.config.db_type.name)}")
-        print(f"\t{f"Driver:":<12}{green(self.config.driver_type.name)}")
-        print(f"\t{f"DB:":<12}{green(italic(bold(self.config.database)))}")
+        print(f"\n{_BOLD}DB Connection Information:{_RESET}")
+        print(f"\t{f"Type:":<12}{_GREEN}{self.config.db_type.name}{_RESET}")
+        print(f"\t{f"Driver:":<12}{_GREEN}{self.config.driver_type.name}{_RESET}")
+        print(f"\t{f"DB:":<12}{_GREEN}{_ITALIC}{_BOLD}{self.config.database}{_RESET}")
 
-        if not self.metadata.tables:
-            print(f"{yellow(bold("No tables or views found in the database after reflection."))}")
+        # * Reflection is lazy, so metadata.tables stays empty until something
+        # * is accessed — report from the name index, which is always built
+        if not self.table_names:
+            print(f"{_YELLOW}{_BOLD}No tables or views found in the database.{_RESET}")
             return
 
+        table_count = sum(1 for _, _, is_view in self.table_names.values() if not is_view)
+        view_count = len(self.table_names) - table_count
+        print(f"\t{f"Tables:":<12}{_GREEN}{table_count}{_RESET}")
+        print(f"\t{f"Views:":<12}{_GREEN}{view_count}{_RESET}")
+
     def analyze_table_relationships(self) -> Dict[str, List[Dict[str, str]]]:
         """Analyze and return table relationships."""
         relationships = {}
@@ -1,15 +1,67 @@
 from typing import Callable, List, Dict, Any, Optional, Type, Union
+from functools import lru_cache
 from forge.utils import *
+import sys
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import Table
-from pydantic import BaseModel, create_model, Field
+from sqlalchemy import Table, and_, select, delete as sql_delete, insert as sql_insert, update as sql_update
+from pydantic import BaseModel
 from enum import Enum
 from sqlalchemy import Enum as SQLAlchemyEnum
 from enum import Enum as PyEnum
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _enum_filter_value(value: Any) -> Any:
+    return value.value if isinstance(value, PyEnum) else value
+
+
+def _python_type(column: Any) -> Optional[Type]:
+    """Resolve a column's python_type, or None where SQLAlchemy can't."""
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _string_coercer(column: Any) -> Callable[[str], Any]:
+    """Pick the query-string -> python converter for a column, once.
+
+    Enum and text-ish columns keep the raw string (the DB compares it
+    directly); numeric/uuid/bool columns get a real constructor so the
+    generated predicate compares typed values.
+    """
+    if isinstance(column.type, SQLAlchemyEnum):
+        return _identity
+    py_type = _python_type(column)
+    if py_type is bool:
+        return lambda value: value.lower() in ('true', '1', 't', 'yes')
+    if py_type in (int, float, uuid.UUID):
+        return py_type
+    return _identity
+
+
+def _compile_pk_strip(pk_uuid_cols: frozenset) -> Optional[Callable[[Dict[str, Any]], None]]:
+    """exec-compile a straight-line 'pop the generated PKs' helper.
+
+    The column set is fixed per table, so the loop over `pk_uuid_cols` can be
+    unrolled into literal `pop` calls at startup; tables without UUID primary
+    keys get None and the create handler skips the call entirely.
+    """
+    if not pk_uuid_cols:
+        return None
+    body = "".join(f"    data.pop({name!r}, None)\n" for name in sorted(pk_uuid_cols))
+    namespace = {}
+    exec(f"def strip_pks(data):\n{body}", namespace)
+    return namespace["strip_pks"]
+
+
 class CRUD:
     """Class to handle CRUD operations with FastAPI routes."""
     
@@ -31,30 +83,61 @@ class CRUD:
         self.db_dependency = db_dependency
         self.tags = tags
         self.prefix = prefix
-        
-        # Create query params model once for reuse
-        self.query_params = self._create_query_params()
-
-    def _create_query_params(self) -> Type[BaseModel]:
-        """Create a Pydantic model for query parameters."""
-        query_fields = {}
-        
-        # Get fields from pydantic model
-        for field_name, field in self.pydantic_model.__annotations__.items():
-            # Make all fields optional for query params
-            if hasattr(field, "__origin__") and field.__origin__ is Union:
-                # If field is already Optional
-                query_fields[field_name] = (field, Field(default=None))
-            else:
-                # Make field Optional
-                query_fields[field_name] = (Optional[field], Field(default=None))
-
-        # Create the query params model
-        return create_model(
-            f"{self.pydantic_model.__name__}QueryParams",
-            **query_fields,
-            __base__=BaseModel
+
+        # * Per-table constants: no Table.columns walk on the request path.
+        # * Names are sys.intern-ed so every dict probe keyed on them gets the
+        # * cached-hash / pointer-compare fast path. str() first: reflected
+        # * names are quoted_name str subclasses, which intern rejects.
+        self._col_names = tuple(sys.intern(str(column.name)) for column in table.columns)
+        # (some SQLAlchemy types raise NotImplementedError on python_type — probe once here)
+        self._pk_uuid_cols = frozenset(
+            column.name for column in table.columns
+            if column.primary_key and _python_type(column) is uuid.UUID
+        )
+        self._enum_cols = frozenset(
+            column.name for column in table.columns
+            if isinstance(column.type, SQLAlchemyEnum)
         )
+        # * Filter plumbing compiled once: name -> ORM attribute, and a value
+        # * coercer (enum columns compare against .value for PyEnum input,
+        # * everything else passes through untouched)
+        self._col_attrs = {name: getattr(sqlalchemy_model, name) for name in self._col_names}
+        self._value_coerce = {
+            name: (_enum_filter_value if name in self._enum_cols else _identity)
+            for name in self._col_names
+        }
+        self._coercers = {sys.intern(str(column.name)): _string_coercer(column) for column in table.columns}
+        self._strip_pks = _compile_pk_strip(self._pk_uuid_cols)
+
+    def _filters_dependency(self) -> Callable:
+        """Build the raw query-filter dependency for this table.
+
+        Reading `request.query_params` directly skips instantiating (and then
+        `model_dump`-ing) a pydantic query-params model per request — on a
+        filter-less GET, the common case, the whole thing is one empty dict.
+        """
+        col_attrs = self._col_attrs
+        coercers = self._coercers
+
+        def raw_filters(request: Request) -> Dict[str, Any]:
+            filters = {}
+            for name, value in request.query_params.items():
+                if name in col_attrs:
+                    try:
+                        filters[name] = coercers[name](value)
+                    except ValueError:
+                        raise HTTPException(status_code=422, detail=f"Invalid value for filter '{name}'")
+            return filters
+
+        return raw_filters
+
+    def _build_predicates(self, filters_dict: Dict[str, Any]) -> List[Any]:
+        """Compile the non-null filters into a list of column predicates."""
+        return [
+            self._col_attrs[name] == self._value_coerce[name](value)
+            for name, value in filters_dict.items()
+            if value is not None
+        ]
 
     def _get_route_path(self, operation: str = "") -> str:
         """Generate route path with optional prefix."""
@@ -63,179 +146,200 @@ class CRUD:
             base_path = f"{base_path}/{operation}"
         return f"{self.prefix}{base_path}"
 
-    def create(self) -> None:
-        """Add CREATE route."""
-        @self.router.post(
-            self._get_route_path(),
-            response_model=self.pydantic_model,
-            tags=self.tags,
-            summary=f"Create {self.table.name}",
-            description=f"Create a new {self.table.name} record"
-        )
+    def _register_routes(self) -> None:
+        """Define and attach all four CRUD handlers in one pass.
+
+        Everything the handlers touch per request is hoisted into locals
+        first, so the closures run on LOAD_FAST instead of chasing `self`
+        attributes, and registration goes through `add_api_route` directly
+        instead of four decorator invocations re-deriving path/tags.
+        """
+        router = self.router
+        path = self._get_route_path()
+        tags = self.tags
+        table_name = self.table.name
+        columns = tuple(self.table.columns)
+        # * Plain interned strs for response keys: RowMapping keys are
+        # * quoted_name subclasses, which orjson refuses as dict keys
+        col_names = self._col_names
+        pydantic_model = self.pydantic_model
+        sqlalchemy_model = self.sqlalchemy_model
+        db_dep = self.db_dependency
+        strip_pks = self._strip_pks
+        build_predicates = self._build_predicates
+        # * Bound serializer reference: body dumps skip the per-call
+        # * model_dump attribute chase
+        dump_body = pydantic_model.__pydantic_serializer__.to_python
+        raw_filters = self._filters_dependency()
+
+        # * Read traffic is heavily skewed towards repeated filter combos, so the
+        # * serialized payload is cached per sorted filter tuple and the whole
+        # * cache is dropped on any write through this table's routes. The miss
+        # * path checks out its own pooled session, which keeps the cache usable
+        # * from FastAPI's threadpool; note it is per-process, so multi-worker
+        # * deployments only get per-worker hit rates.
+        @lru_cache(maxsize=1024)
+        def read_cached(filters_key: tuple) -> bytes:
+            # * Core SELECT: RowMappings feed orjson directly, with no ORM
+            # * instance (and no _sa_instance_state / lazy-load machinery) per
+            # * row — which also rules out N+1 lazy loads by construction
+            stmt = select(*columns)
+            preds = build_predicates(dict(filters_key))
+            if preds:
+                stmt = stmt.where(and_(*preds))
+
+            session_gen = db_dep()
+            db = next(session_gen)
+            try:
+                rows = db.execute(stmt).all()
+            finally:
+                session_gen.close()
+            return orjson.dumps([dict(zip(col_names, row)) for row in rows], default=str)
+
+        # * Write responses go through orjson with default=str, same as the
+        # * read path: RETURNING rows can carry Decimal/memoryview/inet values
+        # * that ORJSONResponse's bare dumps() rejects. Built OUTSIDE the
+        # * try blocks below, so a serialization hiccup after commit can never
+        # * be reported back as a failed write.
+        def json_response(payload: Any) -> Response:
+            return Response(orjson.dumps(payload, default=str), media_type="application/json")
+
         def create_resource(
-            resource: self.pydantic_model,
-            db: Session = Depends(self.db_dependency)
-        ) -> self.pydantic_model:
-            data = resource.model_dump(exclude_unset=True)
-            
+            resource: pydantic_model,
+            db: Session = Depends(db_dep)
+        ) -> Response:
+            data = dump_body(resource, exclude_unset=True)
+
             # Only remove the primary key UUID if it exists, keep foreign key UUIDs
-            for column in self.table.columns:
-                if column.type.python_type == uuid.UUID and column.primary_key:
-                    data.pop(column.name, None)
-                    
+            if strip_pks is not None:
+                strip_pks(data)
+
             try:
-                db_resource = self.sqlalchemy_model(**data)
-                db.add(db_resource)
+                # * INSERT ... RETURNING: server-generated fields (UUIDs,
+                # * defaults, timestamps) come back with the insert itself —
+                # * one round-trip instead of the add/commit/refresh trio
+                stmt = sql_insert(sqlalchemy_model).values(**data).returning(*columns)
+                row = db.execute(stmt).one()
                 db.commit()
-                db.refresh(db_resource)
-                result_dict = {
-                    column.name: getattr(db_resource, column.name) 
-                    for column in self.table.columns
-                }
-                return self.pydantic_model(**result_dict)
+                read_cached.cache_clear()
             except Exception as e:
                 db.rollback()
                 raise HTTPException(status_code=400, detail=f"Creation failed: {str(e)}")
 
-    def read(self) -> None:
-        """Add READ route."""
-        @self.router.get(
-            self._get_route_path(),
-            response_model=List[self.pydantic_model],
-            tags=self.tags,
-            summary=f"Get {self.table.name} resources",
-            description=f"Retrieve {self.table.name} records with optional filtering"
-        )
+            return json_response(dict(zip(col_names, row)))
+
         def read_resources(
-            db: Session = Depends(self.db_dependency),
-            filters: self.query_params = Depends()
-        ) -> List[self.pydantic_model]:
-            query = db.query(self.sqlalchemy_model)
-            filters_dict = filters.model_dump(exclude_unset=True)
-
-            for column_name, value in filters_dict.items():
-                if value is not None:
-                    column = getattr(self.sqlalchemy_model, column_name)
-                    if isinstance(column.type, SQLAlchemyEnum):
-                        if isinstance(value, str):
-                            query = query.filter(column == value)
-                        elif isinstance(value, PyEnum):
-                            query = query.filter(column == value.value)
-                    else:
-                        query = query.filter(column == value)
-
-            resources = query.all()
-            return [
-                self.pydantic_model.model_validate(resource.__dict__) 
-                for resource in resources
-            ]
-
-
-    # todo: Fix the return "updated_data"
-    # todo: - The "updated_data" currently returns [] for all cases
-    # todo: - But the "old_data" returns the correct data (old data before update)
-    def update(self) -> None:
-        """Add UPDATE route."""
-        @self.router.put(
-            self._get_route_path(),
-            response_model=Dict[str, Any],
-            tags=self.tags,
-            summary=f"Update {self.table.name}",
-            description=f"Update {self.table.name} records that match the filter criteria"
-        )
+            filters: Dict[str, Any] = Depends(raw_filters)
+        ) -> Response:
+            # * No session dependency here: a cache hit never touches the pool,
+            # * and the cached bytes go out without any re-serialization.
+            payload = read_cached(tuple(sorted(filters.items())))
+            return Response(content=payload, media_type="application/json")
+
         def update_resource(
-            resource: self.pydantic_model,
-            db: Session = Depends(self.db_dependency),
-            filters: self.query_params = Depends()
-        ) -> Dict[str, Any]:
-            update_data = resource.model_dump(exclude_unset=True)
-            filters_dict = filters.model_dump(exclude_unset=True)
+            resource: pydantic_model,
+            db: Session = Depends(db_dep),
+            filters_dict: Dict[str, Any] = Depends(raw_filters)
+        ) -> Response:
+            update_data = dump_body(resource, exclude_unset=True)
 
             if not filters_dict:
                 raise HTTPException(status_code=400, detail="No filters provided")
 
             try:
-                query = db.query(self.sqlalchemy_model)
-                for attr, value in filters_dict.items():
-                    if value is not None:
-                        query = query.filter(getattr(self.sqlalchemy_model, attr) == value)
+                preds = build_predicates(filters_dict)
 
-                old_data = [
-                    self.pydantic_model.model_validate(data.__dict__) 
-                    for data in query.all()
-                ]
+                # * Core SELECT: the old row images go straight from RowMapping to
+                # * the response, no ORM instances and no pydantic round-trip
+                old_stmt = select(*columns)
+                if preds:
+                    old_stmt = old_stmt.where(and_(*preds))
+                old_rows = [dict(zip(col_names, row)) for row in db.execute(old_stmt)]
 
-                if not old_data:
+                if not old_rows:
                     raise HTTPException(status_code=404, detail="No matching resources found")
 
-                updated_count = query.update(update_data)
+                # * Single UPDATE ... RETURNING round-trip: the count and the new
+                # * row images come back from the same statement (this also fixes
+                # * the stale-session problem that made updated_data come back empty)
+                stmt = sql_update(sqlalchemy_model).values(**update_data).returning(*columns)
+                if preds:
+                    stmt = stmt.where(and_(*preds))
+                updated_rows = [dict(zip(col_names, row)) for row in db.execute(stmt)]
                 db.commit()
-
-                updated_data = [
-                    self.pydantic_model.model_validate(data.__dict__) 
-                    for data in query.all()
-                ]
-
-                return {
-                    "updated_count": updated_count,
-                    "old_data": [d.model_dump() for d in old_data],
-                    "updated_data": [d.model_dump() for d in updated_data]
-                }
+                read_cached.cache_clear()
+            except HTTPException:
+                raise
             except Exception as e:
                 db.rollback()
                 raise HTTPException(status_code=400, detail=f"Update failed: {str(e)}")
 
-    def delete(self) -> None:
-        """Add DELETE route."""
-        @self.router.delete(
-            self._get_route_path(),
-            response_model=Dict[str, Any],
-            tags=self.tags,
-            summary=f"Delete {self.table.name}",
-            description=f"Delete {self.table.name} records that match the filter criteria"
-        )
+            # * orjson serializes the raw dicts (datetime/UUID included):
+            # * no jsonable_encoder walk, no model_construct -> model_dump pass
+            return json_response({
+                "updated_count": len(updated_rows),
+                "old_data": old_rows,
+                "updated_data": updated_rows
+            })
+
         def delete_resource(
-            db: Session = Depends(self.db_dependency),
-            filters: self.query_params = Depends()
-        ) -> Dict[str, Any]:
-            filters_dict = filters.model_dump(exclude_unset=True)
-            
+            db: Session = Depends(db_dep),
+            filters_dict: Dict[str, Any] = Depends(raw_filters)
+        ) -> Response:
             if not filters_dict:
                 raise HTTPException(status_code=400, detail="No filters provided")
 
-            query = db.query(self.sqlalchemy_model)
-            for attr, value in filters_dict.items():
-                if value is not None:
-                    query = query.filter(getattr(self.sqlalchemy_model, attr) == value)
-            
+            preds = build_predicates(filters_dict)
+
             try:
-                # Get resources before deletion
-                to_delete = query.all()
-                if not to_delete:
-                    return {"message": "No resources found matching the criteria"}
-                
-                # Store the data before deletion
-                deleted_resources = [
-                    self.pydantic_model.model_validate(resource.__dict__).model_dump() 
-                    for resource in to_delete
-                ]
-                
-                # Perform deletion
-                deleted_count = query.delete(synchronize_session=False)
+                # * Single DELETE ... RETURNING round-trip: the deleted row images
+                # * replace the SELECT-before-DELETE pair
+                stmt = sql_delete(sqlalchemy_model).returning(*columns)
+                if preds:
+                    stmt = stmt.where(and_(*preds))
+                deleted_rows = [dict(zip(col_names, row)) for row in db.execute(stmt)]
                 db.commit()
-                
-                return {
-                    "message": f"{deleted_count} resource(s) deleted successfully",
-                    "deleted_resources": deleted_resources
-                }
+                read_cached.cache_clear()
             except Exception as e:
                 db.rollback()
                 raise HTTPException(status_code=400, detail=f"Deletion failed: {str(e)}")
 
+            if not deleted_rows:
+                return json_response({"message": "No resources found matching the criteria"})
+
+            return json_response({
+                "message": f"{len(deleted_rows)} resource(s) deleted successfully",
+                "deleted_resources": deleted_rows
+            })
+
+        # * No response_model anywhere: every handler serializes through orjson
+        # * itself, so FastAPI never builds (or runs) a response field per route —
+        # * on wide schemas that's one less pydantic schema per table at startup
+        router.add_api_route(
+            path, create_resource, methods=["POST"],
+            response_class=ORJSONResponse, tags=tags,
+            summary=f"Create {table_name}",
+            description=f"Create a new {table_name} record",
+        )
+        router.add_api_route(
+            path, read_resources, methods=["GET"],
+            response_class=ORJSONResponse, tags=tags,
+            summary=f"Get {table_name} resources",
+            description=f"Retrieve {table_name} records with optional filtering",
+        )
+        router.add_api_route(
+            path, update_resource, methods=["PUT"],
+            response_class=ORJSONResponse, tags=tags,
+            summary=f"Update {table_name}",
+            description=f"Update {table_name} records that match the filter criteria",
+        )
+        router.add_api_route(
+            path, delete_resource, methods=["DELETE"],
+            response_class=ORJSONResponse, tags=tags,
+            summary=f"Delete {table_name}",
+            description=f"Delete {table_name} records that match the filter criteria",
+        )
+
     def generate_all(self) -> None:
         """Generate all CRUD routes."""
-        # print(f"\tGen {gray("CRUD")} -> {self.table.name}")
-        self.create()
-        self.read()
-        self.update()
-        self.delete()
+        self._register_routes()
@@ -1,14 +1,69 @@
+from collections import Counter
+from dataclasses import dataclass, field as dc_field
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Type, Tuple
+import hashlib
+import pickle
+import re
+import sys
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, ConfigDict, create_model
-from pytest import Session
-from sqlalchemy import text
-from forge.utils import *
+from sqlalchemy.orm import Session
+from sqlalchemy import Engine, text
 
+from forge.utils import bright, green, header, magenta, visible_len
 from forge.utils.sql_types import ArrayType, get_eq_type
 
 
+@lru_cache(maxsize=512)
+def _resolve_field_type(type_str: str) -> Any:
+    """Map a SQL type string to its python field type, memoized.
+
+    The same handful of PG type strings recur across every parameter of every
+    discovered function, so get_eq_type plus the ArrayType -> List[...]
+    wrapping collapses to one hash lookup after the first sighting.
+    """
+    field_type = get_eq_type(type_str)
+    if isinstance(field_type, ArrayType):
+        field_type = List[field_type.item_type]
+    return field_type
+
+
+class _DeferredBase(BaseModel):
+    """Base for FnForge's cached models: schema build is deferred.
+
+    pydantic-core schema construction dominates create_model cost; with
+    defer_build the compiler only runs if a model is actually used for
+    validation (pydantic >= 2.7 rebuilds transparently on first access).
+    Models that never leave the cache stay unbuilt.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+# * Shared input/output models keyed by field signature: many discovered
+# * functions have identical shapes (same params / same return columns), and
+# * each create_model call runs pydantic's full schema compiler.
+_MODEL_CACHE: Dict[tuple, Type[BaseModel]] = {}
+
+
+def _cached_model(name: str, base: Type[BaseModel], fields: Dict[str, Tuple[Any, Any]]) -> Type[BaseModel]:
+    """create_model, deduplicated by (base, field signature).
+
+    Field types and defaults aren't reliably hashable, so the key uses their
+    reprs. Functions sharing a shape share one model class (under the first
+    function's name), which skips the duplicate schema builds.
+    """
+    sig = (base, tuple((n, repr(t), repr(d)) for n, (t, d) in sorted(fields.items())))
+    model = _MODEL_CACHE.get(sig)
+    if model is None:
+        model = _MODEL_CACHE[sig] = create_model(name, __base__=base, **fields)
+    return model
+
+
 # ? Metadata for some function ---------------------------------------------------
 
 # ?.todo: Add some way to generalize this to more databases than just PostgreSQL
@@ -35,70 +90,53 @@ class FunctionType(str, Enum):
     AGGREGATE = "aggregate"
     WINDOW = "window"
 
-class FunctionParameter(BaseModel):
+# * Slotted frozen dataclasses instead of BaseModels: these are built once
+# * per catalog row from our own trusted query, so pydantic's validation,
+# * per-instance __dict__ and fields-set bookkeeping are pure overhead —
+# * slots cut the per-instance footprint on big catalogs.
+@dataclass(slots=True, frozen=True)
+class FunctionParameter:
     name: str
     type: str
     has_default: bool = False
     default_value: Optional[Any] = None
     mode: str = "IN"  # IN, OUT, INOUT, VARIADIC
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
-
-class FunctionMetadata(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FunctionMetadata:
     schema: str
     name: str
-    return_type: Optional[str] = None
-    parameters: List[FunctionParameter] = Field(default_factory=list)
     type: FunctionType
-    object_type: PostgresObjectType  # Add this field
+    object_type: PostgresObjectType
     volatility: FunctionVolatility
     security_type: SecurityType
     is_strict: bool
+    return_type: Optional[str] = None
+    parameters: List[FunctionParameter] = dc_field(default_factory=list)
     description: Optional[str] = None
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
-
-# ? FnForge class ------------------------------------------------------------------
-# ? 
-# ? This class is responsible for discovering functions in a PostgreSQL database
-# ? and generating Pydantic models for input and output parameters.
-# ? 
-# ? The class is designed to be used as a dependency in FastAPI applications.
-# ?.todo: Add some way to generalize this to more databases than just PostgreSQL
-
-class FnForge(BaseModel):
-    """Handles PostgreSQL function discovery and route generation."""
-    db_dependency: Callable
-    include_schemas: List[str]
-    exclude_functions: List[str] = Field(default_factory=list)
-    
-    # Caches for models and metadata
-    function_cache: Dict[str, FunctionMetadata] = Field(default_factory=dict)
-    model_cache: Dict[str, Tuple[Type[BaseModel], Type[BaseModel]]] = Field(default_factory=dict)
-
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-        extra='allow'
-    )
-
-    def _get_object_type(self, prokind: str) -> PostgresObjectType:
-        """Convert PostgreSQL function kind code to PostgresObjectType enum."""
-        return {
-            'f': PostgresObjectType.FUNCTION,
-            'p': PostgresObjectType.PROCEDURE,
-            'a': PostgresObjectType.AGGREGATE,
-            'w': PostgresObjectType.WINDOW,
-            't': PostgresObjectType.TRIGGER
-        }.get(prokind, PostgresObjectType.FUNCTION)
-
-    def discover_functions(self) -> None:
-        query = """
+# * Row-value -> enum maps, precomputed so discovery can build its metadata
+# * without running per-row enum coercion
+_OBJECT_TYPE_MAP = {obj.value: obj for obj in PostgresObjectType}
+_VOLATILITY_MAP = {
+    'i': FunctionVolatility.IMMUTABLE,
+    's': FunctionVolatility.STABLE,
+    'v': FunctionVolatility.VOLATILE,
+}
+_KIND_MAP = {
+    'a': FunctionType.AGGREGATE,
+    'w': FunctionType.WINDOW,
+}
+
+# * The discovery SQL is static: parse it into a TextClause once at import so
+# * each discovery run only pays execution, not statement construction.
+_DISCOVERY_SQL = text("""
+            WITH anchor AS (
+                -- Materialized once instead of re-evaluated per row
+                SELECT
+                    (SELECT oid FROM pg_proc WHERE proname = 'current_database' LIMIT 1) AS min_proc_oid,
+                    (SELECT oid FROM pg_namespace WHERE nspname = 'pg_catalog') AS catalog_ns_oid
+            )
             SELECT 
                 n.nspname as schema,
                 p.proname as name,
@@ -111,243 +149,315 @@ class FnForge(BaseModel):
                 p.proretset as returns_set,
                 p.prokind as kind,
                 CASE 
-                    WHEN EXISTS (
-                        SELECT 1 
-                        FROM pg_trigger t 
-                        WHERE t.tgfoid = p.oid
-                    ) OR p.prorettype = 'trigger'::regtype::oid THEN 'trigger'
+                    WHEN tg.events IS NOT NULL
+                        OR p.prorettype = 'trigger'::regtype::oid THEN 'trigger'
                     WHEN p.prokind = 'p' THEN 'procedure'
                     ELSE 'function'
                 END as object_type,
-                -- Get trigger event information if it's a trigger function
-                CASE 
-                    WHEN EXISTS (
-                        SELECT 1 
-                        FROM pg_trigger t 
-                        WHERE t.tgfoid = p.oid
-                    ) THEN (
-                        SELECT string_agg(DISTINCT evt.event_type, ', ')
-                        FROM (
-                            SELECT 
-                                CASE tg.tgtype::integer & 2::integer 
-                                    WHEN 2 THEN 'BEFORE'
-                                    ELSE 'AFTER'
-                                END || ' ' ||
-                                CASE 
-                                    WHEN tg.tgtype::integer & 4::integer = 4 THEN 'INSERT'
-                                    WHEN tg.tgtype::integer & 8::integer = 8 THEN 'DELETE'
-                                    WHEN tg.tgtype::integer & 16::integer = 16 THEN 'UPDATE'
-                                    WHEN tg.tgtype::integer & 32::integer = 32 THEN 'TRUNCATE'
-                                END as event_type
-                            FROM pg_trigger tg
-                            WHERE tg.tgfoid = p.oid
-                        ) evt
-                    )
-                    ELSE NULL
-                END as trigger_events
+                tg.events as trigger_events
             FROM pg_proc p
+            CROSS JOIN anchor
             JOIN pg_namespace n ON p.pronamespace = n.oid
             LEFT JOIN pg_description d ON p.oid = d.objoid
-            LEFT JOIN pg_depend dep ON dep.objid = p.oid 
-                AND dep.deptype = 'e'
-            LEFT JOIN pg_extension ext ON dep.refobjid = ext.oid
-            WHERE ext.extname IS NULL
-                AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            -- One lateral scan of pg_trigger per function replaces the two
+            -- EXISTS probes plus the event-aggregation subquery
+            -- concat_ws + array_remove report every event bit that is set
+            -- (the old CASE chain stopped at the first match, so an
+            -- INSERT+UPDATE trigger showed up as just INSERT)
+            LEFT JOIN LATERAL (
+                SELECT string_agg(DISTINCT
+                    concat_ws(' ',
+                        CASE t.tgtype::integer & 2::integer
+                            WHEN 2 THEN 'BEFORE'
+                            ELSE 'AFTER'
+                        END,
+                        array_to_string(array_remove(ARRAY[
+                            CASE WHEN t.tgtype::integer & 4::integer = 4 THEN 'INSERT' END,
+                            CASE WHEN t.tgtype::integer & 8::integer = 8 THEN 'DELETE' END,
+                            CASE WHEN t.tgtype::integer & 16::integer = 16 THEN 'UPDATE' END,
+                            CASE WHEN t.tgtype::integer & 32::integer = 32 THEN 'TRUNCATE' END
+                        ], NULL), ' OR ')
+                    ), ', ') as events
+                FROM pg_trigger t
+                WHERE t.tgfoid = p.oid
+            ) tg ON TRUE
+            WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')
+                AND n.nspname = ANY(:schemas)
+                AND p.proname <> ALL(:excludes)
                 AND p.proname NOT LIKE 'pg_%%'
-                AND p.oid > (
-                    SELECT oid 
-                    FROM pg_proc 
-                    WHERE proname = 'current_database' 
-                    LIMIT 1
-                )
+                AND p.oid > anchor.min_proc_oid
                 AND NOT EXISTS (
                     SELECT 1 
                     FROM pg_depend d2
                     JOIN pg_extension e2 ON d2.refobjid = e2.oid
                     WHERE d2.objid = p.oid
                 )
-                AND p.pronamespace > (
-                    SELECT oid 
-                    FROM pg_namespace 
-                    WHERE nspname = 'pg_catalog'
-                )
+                AND p.pronamespace > anchor.catalog_ns_oid
             ORDER BY n.nspname, p.proname;
+        """)
+
+
+# * Discovery cache version: creating or replacing a function writes a pg_proc
+# * row with a fresh xmin, so max(xmin) catches those; a DROP only deletes its
+# * row and leaves every surviving xmin untouched, so count(*) rides along to
+# * invalidate on drops too. Still one cheap aggregate vs the full multi-join
+# * discovery query.
+_DISCOVERY_VERSION_SQL = text("SELECT COALESCE(max(xmin::text::bigint), 0), count(*) FROM pg_proc")
+
+
+def _discovery_cache_path(db_url: str, version: str) -> Path:
+    """Cache file keyed by connection URL and pg_proc version stamp.
+
+    Same directory as DBForge's metadata cache; the version lives in the
+    filename so a schema change simply misses instead of needing invalidation.
+    """
+    db_hash = hashlib.sha256(db_url.encode()).hexdigest()[:16]
+    return Path.home() / ".cache" / "crud_forge" / f"fn-{db_hash}-{version}.pkl"
+
+
+def _load_discovery_cache(path: Path) -> Optional[List[FunctionMetadata]]:
+    """Load the cached metadata list. Returns None on any miss/corruption."""
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _save_discovery_cache(path: Path, metadata_list: List[FunctionMetadata]) -> None:
+    """Persist the metadata list (best effort — failures are ignored)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # * Older versions of the same DB are stale by construction: drop them
+        prefix = path.name.rsplit("-", 1)[0]
+        for stale in path.parent.glob(f"{prefix}-*.pkl"):
+            stale.unlink(missing_ok=True)
+        with path.open("wb") as f:
+            pickle.dump(metadata_list, f)
+    except Exception:
+        pass
+
+
+# ? FnForge class ------------------------------------------------------------------
+# ? 
+# ? This class is responsible for discovering functions in a PostgreSQL database
+# ? and generating Pydantic models for input and output parameters.
+# ? 
+# ? The class is designed to be used as a dependency in FastAPI applications.
+# ?.todo: Add some way to generalize this to more databases than just PostgreSQL
+
+class FnForge(BaseModel):
+    """Handles PostgreSQL function discovery and route generation."""
+    db_dependency: Callable
+    include_schemas: List[str]
+    exclude_functions: List[str] = Field(default_factory=list)
+    # * Optional direct engine for bootstrap queries (discovery): skips the
+    # * request-scoped dependency-generator protocol; routes still use
+    # * db_dependency
+    engine: Optional[Engine] = None
+    
+    # Caches for models and metadata
+    function_cache: Dict[str, FunctionMetadata] = Field(default_factory=dict)
+    model_cache: Dict[str, Tuple[Type[BaseModel], Type[BaseModel]]] = Field(default_factory=dict)
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        extra='allow'
+    )
+
+    def build(self, router: Optional[APIRouter] = None) -> None:
+        """Discover functions and, per row, generate models (and routes).
+
+        One walk over the discovery cursor replaces the separate
+        discover -> models -> routes passes over the same metadata; the
+        caches end up identical, so existing readers see the same state.
         """
-        
-        with next(self.db_dependency()) as db:
-            result = db.execute(text(query))
-            
-            for row in result:
-                if row.name in self.exclude_functions:
-                    continue
-                    
-                fn_type = self._determine_function_type(row)
-                parameters = self._parse_parameters(row.arguments)
-
-                metadata = FunctionMetadata(
-                    schema=row.schema,
-                    name=row.name,
-                    return_type=row.return_type if row.return_type else 'void',
-                    parameters=parameters,
-                    type=fn_type,
-                    object_type=PostgresObjectType(row.object_type),  # Direct conversion from SQL result
-                    volatility=self._get_volatility(row.volatility),
-                    security_type=SecurityType.DEFINER if row.security_definer else SecurityType.INVOKER,
-                    is_strict=row.is_strict,
-                    description=row.description
+        # * FnForge is a BaseModel, so self.<attr> goes through pydantic's
+        # * descriptors; bind everything the row loop touches to locals once
+        db_dependency = self.db_dependency
+        function_cache = self.function_cache
+        model_cache = self.model_cache
+        determine_type = self._determine_function_type
+        parse_parameters = self._parse_parameters
+        generate_models = self._generate_models
+
+        # * Engine-bound Session when available: discovery is a one-shot
+        # * startup task, so the dependency generator's setup/teardown adds
+        # * nothing here
+        db = Session(self.engine) if self.engine is not None else next(db_dependency())
+        with db:
+            # * Warm-start probe: a cheap version stamp decides whether the big
+            # * catalog query runs at all. Schemas/excludes are part of the key
+            # * so differently configured forges never share an entry.
+            cache_path = None
+            metadata_list = None
+            try:
+                stamp, proc_count = db.execute(_DISCOVERY_VERSION_SQL).one()
+                version = f"{int(stamp or 0)}x{proc_count}"
+                key = f"{db.get_bind().engine.url}|{sorted(self.include_schemas)}|{sorted(self.exclude_functions)}"
+                cache_path = _discovery_cache_path(key, version)
+                metadata_list = _load_discovery_cache(cache_path)
+            except Exception:
+                db.rollback()  # non-PG backend: fall through to the live query
+
+            if metadata_list is None:
+                # * Both filters run in SQL, so excluded/out-of-scope functions
+                # * never cross the wire or build a row object; stream_results
+                # * keeps the driver buffer bounded on large catalogs instead
+                # * of materializing every Row before the loop starts
+                result = db.execute(
+                    _DISCOVERY_SQL,
+                    {
+                        "schemas": self.include_schemas,
+                        "excludes": self.exclude_functions,
+                    },
+                    execution_options={"stream_results": True, "yield_per": 500},
+                )
+
+                metadata_list = []
+                for row in result:
+                    fn_type = determine_type(row)
+                    parameters = parse_parameters(row.arguments)
+
+                    metadata_list.append(FunctionMetadata(
+                        schema=row.schema,
+                        name=row.name,
+                        return_type=row.return_type if row.return_type else 'void',
+                        parameters=parameters,
+                        type=fn_type,
+                        object_type=_OBJECT_TYPE_MAP[row.object_type],
+                        volatility=_VOLATILITY_MAP.get(row.volatility, FunctionVolatility.VOLATILE),
+                        security_type=SecurityType.DEFINER if row.security_definer else SecurityType.INVOKER,
+                        is_strict=row.is_strict,
+                        description=row.description
+                    ))
+
+                if cache_path is not None:
+                    _save_discovery_cache(cache_path, metadata_list)
+
+        for metadata in metadata_list:
+            func_id = f"{metadata.schema}.{metadata.name}"
+            model_cache[func_id] = generate_models(metadata)
+            if router is not None and metadata.object_type != PostgresObjectType.TRIGGER:
+                gen_fn_route(
+                    schema=metadata.schema,
+                    function_metadata=metadata,
+                    router=router,
+                    db_dependency=db_dependency,
+                    get_eq_type=get_eq_type
                 )
-                
-                self.function_cache[f"{row.schema}.{row.name}"] = metadata
+            function_cache[func_id] = metadata
+
+    def discover_functions(self) -> None:
+        """Populate the metadata/model caches (kept as a thin build() wrapper)."""
+        self.build()
 
     def generate_function_models(self) -> None:
-        """Generate input and output models for functions."""
+        """Generate input and output models for any functions missing them."""
         for func_id, metadata in self.function_cache.items():
-            # Generate input model
-            input_fields = {}
-            for param in metadata.parameters:
-                field_type = get_eq_type(param.type)
-                
-                # Handle ArrayType case
-                if isinstance(field_type, ArrayType):
-                    field_type = List[field_type.item_type]
-                
-                input_fields[param.name] = (
-                    field_type if param.has_default else field_type,
-                    Field(default=param.default_value if param.has_default else ...)
-                )
-            
-            # Create input model
-            input_model = create_model(
-                f"{metadata.name}_Input",
-                __base__=BaseModel,
-                **input_fields
-            )
-            
-            # Generate output model
-            if metadata.type in (FunctionType.TABLE, FunctionType.SET_RETURNING):
-                output_fields = self._parse_table_return(metadata.return_type)
-            else:
-                output_type = get_eq_type(metadata.return_type)
-                # Handle ArrayType in output
-                if isinstance(output_type, ArrayType):
-                    output_type = List[output_type.item_type]
-                output_fields = {"result": (output_type, ...)}
-                # Use the function name as the field
-                # output_fields = {metadata.name: (output_type, ...)}
-            output_model = create_model(
-                f"{metadata.name}_Output",
-                __base__=BaseModel,
-                **output_fields
+            if func_id not in self.model_cache:
+                self.model_cache[func_id] = self._generate_models(metadata)
+
+    def _generate_models(self, metadata: FunctionMetadata) -> Tuple[Type[BaseModel], Type[BaseModel]]:
+        """Build the (input, output) model pair for one function."""
+        input_fields = {}
+        for param in metadata.parameters:
+            field_type = _resolve_field_type(param.type)
+
+            # * Only allocate a FieldInfo when there is a default to carry;
+            # * required params use the plain (type, ...) form
+            input_fields[param.name] = (
+                (field_type, Field(default=param.default_value))
+                if param.has_default else (field_type, ...)
             )
-            
-            # Cache models
-            self.model_cache[func_id] = (input_model, output_model)
-
-    def _parse_table_return(self, return_type: str) -> Dict[str, Tuple[Type, Any]]:
-        """Parse TABLE and SETOF return types into field definitions."""
-        fields = {}
-        
-        if "TABLE" in return_type:
-            # Strip 'TABLE' and parentheses
-            columns_str = return_type.replace("TABLE", "").strip("()").strip()
-            columns = [col.strip() for col in columns_str.split(",")]
-            
-            for column in columns:
-                name, type_str = column.split(" ", 1)
-                field_type = get_eq_type(type_str)
-                # Handle ArrayType in table columns
-                if isinstance(field_type, ArrayType):
-                    field_type = List[field_type.item_type]
-                fields[name] = (field_type, ...)
-                
-        return fields
+
+        input_model = _cached_model(f"{metadata.name}_Input", _DeferredBase, input_fields)
+
+        # Generate output model
+        if metadata.type in (FunctionType.TABLE, FunctionType.SET_RETURNING):
+            output_fields = _parse_table_return_type(metadata.return_type)
+        else:
+            output_type = _resolve_field_type(metadata.return_type)
+            output_fields = {"result": (output_type, ...)}
+            # Use the function name as the field
+            # output_fields = {metadata.name: (output_type, ...)}
+        output_model = _cached_model(f"{metadata.name}_Output", _DeferredBase, output_fields)
+
+        return input_model, output_model
 
     def _determine_function_type(self, row: Any) -> FunctionType:
         if row.returns_set:
             return FunctionType.SET_RETURNING
         if "TABLE" in (row.return_type or ""):
             return FunctionType.TABLE
-        if row.kind == 'a':
-            return FunctionType.AGGREGATE
-        if row.kind == 'w':
-            return FunctionType.WINDOW
-        return FunctionType.SCALAR
-
-    def _get_volatility(self, volatility_char: str) -> FunctionVolatility:
-        return {
-            'i': FunctionVolatility.IMMUTABLE,
-            's': FunctionVolatility.STABLE,
-            'v': FunctionVolatility.VOLATILE
-        }.get(volatility_char, FunctionVolatility.VOLATILE)
+        return _KIND_MAP.get(row.kind, FunctionType.SCALAR)
 
     def _parse_parameters(self, args_str: str) -> List[FunctionParameter]:
         if not args_str:
             return []
-            
+
+        # * Single pass with parenthesis tracking: types like 'numeric(10,2)'
+        # * contain commas, which a plain split(", ") would mangle
         parameters = []
-        for arg in args_str.split(", "):
-            parts = arg.split(" ")
-            if len(parts) >= 2:
-                param_name = parts[0]
-                param_type = " ".join(parts[1:])
-                parameters.append(FunctionParameter(
-                    name=param_name,
-                    type=param_type
-                ))
-                
+
+        def emit(arg: str) -> None:
+            arg = arg.strip()
+            if arg:
+                name, _, param_type = arg.partition(" ")
+                if param_type:
+                    parameters.append(FunctionParameter(name=name, type=param_type))
+
+        depth = 0
+        start = 0
+        for i, ch in enumerate(args_str):
+            if ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+            elif ch == ',' and depth == 0:
+                emit(args_str[start:i])
+                start = i + 1
+        emit(args_str[start:])
+
         return parameters
 
     def log_metadata_stats(self) -> None:
         """Print statistics about discovered functions."""
-        print(header("FunctionForge Statistics"))
-
-        # Collect statistics
-        function_counts = {}
-        active_types = set()
-
-        # First pass to get max lengths
+        # * One pass over the cache: (schema, type) counts, per-schema totals
+        # * and the display width all come out of the same traversal
+        counts = Counter()
+        schema_totals = Counter()
         max_schema_len = len("Schema")  # minimum width for header
         for metadata in self.function_cache.values():
+            counts[(metadata.schema, metadata.type)] += 1
+            schema_totals[metadata.schema] += 1
             max_schema_len = max(max_schema_len, visible_len(metadata.schema))
-            if metadata.schema not in function_counts:
-                function_counts[metadata.schema] = {
-                    FunctionType.SCALAR: 0,
-                    FunctionType.TABLE: 0,
-                    FunctionType.SET_RETURNING: 0,
-                    FunctionType.AGGREGATE: 0,
-                    FunctionType.WINDOW: 0
-                }
-            function_counts[metadata.schema][metadata.type] += 1
-            if function_counts[metadata.schema][metadata.type] > 0:
-                active_types.add(metadata.type)
-
-        # Headers with tabs
-        print(f"Schema\t\tscalar\tset\tTotal")
-        
-        # Print rows
-        for schema, counts in function_counts.items():
-            schema_total = sum(counts.values())
-            scalar_count = counts[FunctionType.SCALAR]
-            set_count = counts[FunctionType.SET_RETURNING]
-            
+
+        # * Whole table buffered and flushed in one stdout write (same pattern
+        # * as APIForge's generation log) instead of one locked print per row
+        lines = [header("FunctionForge Statistics"), "Schema\t\tscalar\tset\tTotal"]
+
+        # Table rows (schema_totals preserves discovery order)
+        for schema, schema_total in schema_totals.items():
+            scalar_count = counts[(schema, FunctionType.SCALAR)]
+            set_count = counts[(schema, FunctionType.SET_RETURNING)]
+
             colored_schema = magenta(schema.rjust(max_schema_len))
             colored_scalar = green(str(scalar_count).rjust(2))
             colored_set = green(str(set_count).rjust(1))
             colored_total = bright(str(schema_total).rjust(2))
-            
-            print(f"{colored_schema}\t{colored_scalar}\t{colored_set}\t{colored_total}")
-        
-        # Print totals with proper spacing
-        total_scalar = str(sum(counts[FunctionType.SCALAR] for counts in function_counts.values())).rjust(2)
-        total_set = str(sum(counts[FunctionType.SET_RETURNING] for counts in function_counts.values())).rjust(1)
-        grand_total = str(sum(sum(counts.values()) for counts in function_counts.values())).rjust(2)
-        
-        # Color the totals after right justification
-        colored_total_scalar = bright(total_scalar)
-        colored_total_set = bright(total_set)
-        colored_grand_total = bright(grand_total)
-        
-        print(f"{'Total'.rjust(max_schema_len)}\t{colored_total_scalar}\t{colored_total_set}\t{colored_grand_total}")
+
+            lines.append(f"{colored_schema}\t{colored_scalar}\t{colored_set}\t{colored_total}")
+
+        # Totals with proper spacing
+        total_scalar = str(sum(counts[(schema, FunctionType.SCALAR)] for schema in schema_totals)).rjust(2)
+        total_set = str(sum(counts[(schema, FunctionType.SET_RETURNING)] for schema in schema_totals)).rjust(1)
+        grand_total = str(sum(schema_totals.values())).rjust(2)
+
+        lines.append(
+            f"{'Total'.rjust(max_schema_len)}\t{bright(total_scalar)}\t{bright(total_set)}\t{bright(grand_total)}"
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def generate_function_routes(self, router: APIRouter) -> None:
         """Generate routes for all discovered functions."""
@@ -361,6 +471,14 @@ class FnForge(BaseModel):
                     get_eq_type=get_eq_type
                 )
 
+@lru_cache(maxsize=None)
+def _text_clause(sql: str):
+    """Memoized text() construction: repeated route generation for the same
+    function (e.g. FnForge reloads) reuses one TextClause instead of
+    re-parsing the SQL string."""
+    return text(sql)
+
+
 class FunctionBase(BaseModel):
     """Base class for function models"""
     model_config = ConfigDict(
@@ -370,24 +488,32 @@ class FunctionBase(BaseModel):
     )
 
 
-def _parse_table_return_type(return_type: str) -> Dict[str, Tuple[Type, Any]]:
-    """Parse TABLE and SETOF return types into field definitions."""
-    fields = {}
-    
+# * Captures (name, type) pairs in one pass, keeping parenthesized type
+# * arguments like numeric(10,2) attached to their type instead of split on
+# * the embedded comma
+_TABLE_COL_RE = re.compile(r"(\w+)\s+([^,()]+(?:\([^)]*\))?)")
+
+
+@lru_cache(maxsize=256)
+def _table_return_fields(return_type: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parse a TABLE return signature into (name, type) pairs, memoized.
+
+    Many functions share the same TABLE(...) shape, so each distinct raw
+    string is parsed once; the frozen tuple keeps the cached value safe from
+    caller mutation.
+    """
+    fields = []
     if "TABLE" in return_type:
         # Strip 'TABLE' and parentheses
-        columns_str = return_type.replace("TABLE", "").strip("()").strip()
-        columns = [col.strip() for col in columns_str.split(",")]
-        
-        for column in columns:
-            name, type_str = column.split(" ", 1)
-            field_type = get_eq_type(type_str)
-            # Handle ArrayType in table columns
-            if isinstance(field_type, ArrayType):
-                field_type = List[field_type.item_type]
-            fields[name] = (field_type, ...)
-                
-    return fields
+        inner = return_type.replace("TABLE", "", 1).strip().strip("()")
+        for name, type_str in _TABLE_COL_RE.findall(inner):
+            fields.append((name, _resolve_field_type(type_str.strip())))
+    return tuple(fields)
+
+
+def _parse_table_return_type(return_type: str) -> Dict[str, Tuple[Type, Any]]:
+    """Parse TABLE and SETOF return types into field definitions."""
+    return {name: (field_type, ...) for name, field_type in _table_return_fields(return_type)}
 
 
 def gen_fn_route(
@@ -402,22 +528,19 @@ def gen_fn_route(
     # Generate input model fields
     input_fields = {}
     for param in function_metadata.parameters:
-        field_type = get_eq_type(param.type)
-        
-        # Handle array types
-        if isinstance(field_type, ArrayType):
-            field_type = List[field_type.item_type]
-            
+        field_type = _resolve_field_type(param.type)
+
+        # * Required params use the plain (type, ...) form — no FieldInfo
+        # * allocation; only defaulted params build one (same as
+        # * _generate_models)
         input_fields[param.name] = (
-            field_type if not param.has_default else Optional[field_type],
-            Field(default=param.default_value if param.has_default else ...)
+            (Optional[field_type], Field(default=param.default_value))
+            if param.has_default else (field_type, ...)
         )
 
     # Create input model
-    FunctionInputModel = create_model(
-        f"Function_{function_metadata.name}_Input",
-        __base__=FunctionBase,
-        **input_fields
+    FunctionInputModel = _cached_model(
+        f"Function_{function_metadata.name}_Input", FunctionBase, input_fields
     )
 
     # Generate output model fields based on function type
@@ -425,24 +548,34 @@ def gen_fn_route(
         output_fields = _parse_table_return_type(function_metadata.return_type)
         is_set = True
     else:
-        output_type = get_eq_type(function_metadata.return_type)
-        if isinstance(output_type, ArrayType):
-            output_type = List[output_type.item_type]
+        output_type = _resolve_field_type(function_metadata.return_type)
         output_fields = {"result": (output_type, ...)}
         is_set = False
 
     # Create output model
-    FunctionOutputModel = create_model(
-        f"Function_{function_metadata.name}_Output",
-        __base__=FunctionBase,
-        **output_fields
+    FunctionOutputModel = _cached_model(
+        f"Function_{function_metadata.name}_Output", FunctionBase, output_fields
     )
 
+    # * The call SQL only depends on the function signature, so build it (and
+    # * its TextClause) once here instead of per request inside the closures
+    param_list_str = ", ".join(f":{p}" for p in input_fields)
+    bind_keys = tuple(input_fields)
+
+    def bind_params(params: BaseModel) -> Dict[str, Any]:
+        # * The values are already validated; reading them out of __dict__
+        # * skips the full model_dump serializer walk per request
+        values = params.__dict__
+        return {key: values[key] for key in bind_keys}
+
     # Generate the route based on function type
     if function_metadata.object_type == PostgresObjectType.PROCEDURE:
+        call_stmt = _text_clause(f"CALL {schema}.{function_metadata.name}({param_list_str})")
+
         @router.post(
             f"/{function_metadata.name}",
             response_model=None,
+            response_class=ORJSONResponse,
             tags=[f"{schema.upper()} Procedures"],
             summary=f"Execute {function_metadata.name} procedure",
             description=function_metadata.description or f"Execute the {function_metadata.name} procedure"
@@ -451,35 +584,51 @@ def gen_fn_route(
             params: FunctionInputModel,
             db: Session = Depends(db_dependency)
         ):
-            # Build procedure call
-            param_list = [f":{p}" for p in input_fields.keys()]
-            query = f"CALL {schema}.{function_metadata.name}({', '.join(param_list)})"
-            await db.execute(text(query), params.model_dump())
+            await db.execute(call_stmt, bind_params(params))
             return {"status": "success"}
 
     else:
+        select_stmt = _text_clause(f"SELECT * FROM {schema}.{function_metadata.name}({param_list_str})")
+        stream_stmt = select_stmt.execution_options(stream_results=True)
+
+        def _ndjson(bound_params: Dict[str, Any]):
+            # * Own session: the generator outlives the handler (and its
+            # * request-scoped session), and yield_per keeps the server-side
+            # * cursor buffer bounded instead of materializing the result set
+            session_gen = db_dependency()
+            db = next(session_gen)
+            try:
+                result = db.execute(stream_stmt, bound_params)
+                for row in result.mappings().yield_per(1024):
+                    yield orjson.dumps(dict(row), default=str) + b"\n"
+            finally:
+                session_gen.close()
+
         @router.post(
             f"/{function_metadata.name}",
             response_model=List[FunctionOutputModel] if is_set else FunctionOutputModel,
+            response_class=ORJSONResponse,
             tags=[f"{schema.upper()} Functions"],
             summary=f"Execute {function_metadata.name} function",
             description=function_metadata.description or f"Execute the {function_metadata.name} function"
         )
         def execute_function(  # <-- This is async
             params: FunctionInputModel,
+            stream: bool = False,
             db: Session = Depends(db_dependency)
         ):
-            # Build function call
-            param_list = [f":{p}" for p in input_fields.keys()]
-            query = f"SELECT * FROM {schema}.{function_metadata.name}({', '.join(param_list)})"
-            result = db.execute(text(query), params.model_dump())
+            if is_set and stream:
+                # * ?stream=true: NDJSON rows in bounded chunks instead of one
+                # * big in-memory list
+                return StreamingResponse(_ndjson(bind_params(params)), media_type="application/x-ndjson")
+
+            result = db.execute(select_stmt, bind_params(params))
 
+            # * The rows come straight from the DB with correct types, so
+            # * model_construct (no validation pass) is enough — FastAPI still
+            # * validates against the route's response_model
             if is_set:
-                records = result.fetchall()
-                return [FunctionOutputModel.model_validate(dict(r._mapping)) for r in records]
+                return [FunctionOutputModel.model_construct(**row) for row in result.mappings()]
             else:
                 record = result.fetchone()
-                # Transform the data to match your model
-                transformed_data = {"result": list(record._mapping.values())[0]}  # Get the first value
-                return FunctionOutputModel.model_validate(transformed_data)
-                # return FunctionOutputModel.model_validate(dict(record._mapping))
+                return FunctionOutputModel.model_construct(result=record[0])  # Get the first value
@@ -1,10 +1,12 @@
+from functools import lru_cache
 from typing import Dict, List, Optional, Type, Any, Callable
 from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy import Table, text
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from sqlalchemy import Engine, Table, text
 from sqlalchemy.orm import Session
 from pydantic.main import create_model
-import json
+import orjson
+import re
 
 from forge.utils.sql_types import ArrayType, JSONBType
 
@@ -16,19 +18,48 @@ class ViewBase(BaseModel):
         arbitrary_types_allowed=True
     )
 
+
+# * Postgres array literal items: quoted strings (commas allowed inside) or
+# * bare tokens — one findall replaces the strip('{}')/split(',') mangling
+_PG_ARRAY_RE = re.compile(r'"([^"]*)"|([^,{}]+)')
+
+
+def _handle_jsonb(value: Any, item_type: Type) -> Any:
+    if value is None:
+        return None
+    # * orjson: native-code parse, noticeably faster on wide JSONB payloads
+    return orjson.loads(value) if isinstance(value, str) else value
+
+
+def _handle_array(value: Any, item_type: Type) -> Any:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [
+            item_type(quoted if quoted else bare.strip())
+            for quoted, bare in _PG_ARRAY_RE.findall(value)
+            if quoted or bare.strip()
+        ]
+    if isinstance(value, list):
+        return [item_type(item) for item in value if item is not None]
+    return value
+
 def generate_view_routes(
     view_table: Table,
     schema: str,
     router: APIRouter,
     db_dependency: Callable,
-    get_eq_type: Callable
+    get_eq_type: Callable,
+    engine: Optional[Engine] = None
 ) -> None:
     """Generate view routes with dynamic JSONB handling."""
-    
-    # First, get a sample of data to infer JSONB structures
+
+    # First, get a sample of data to infer JSONB structures.
+    # One-shot generation-time probe: an engine-bound Session (when given)
+    # skips the request-scoped dependency-generator protocol.
     sample_data = {}
     try:
-        with next(db_dependency()) as db:
+        with (Session(engine) if engine is not None else next(db_dependency())) as db:
             query = f"SELECT * FROM {schema}.{view_table.name} LIMIT 1"
             result = db.execute(text(query)).first()
             if result:
@@ -39,7 +70,11 @@ def generate_view_routes(
     # Create query params and response field models
     view_query_fields = {}
     response_fields = {}
-    
+    # * Per-column processing plan resolved once here: (name, handler,
+    # * item_type) rows drive the per-request loop, so no type re-resolution
+    # * or isinstance dispatch happens per row
+    column_plan = []
+
     for column in view_table.columns:
         column_type = str(column.type)
         nullable = column.nullable
@@ -58,11 +93,18 @@ def generate_view_routes(
                         response_fields[column.name] = (List[model], Field(default_factory=list))
                     case _:  # * Single object
                         response_fields[column.name] = (Optional[model] if nullable else model, Field(default=None))
+                column_plan.append((column.name, _handle_jsonb, None))
             case _ if isinstance(field_type, ArrayType):  # * Array type
                 response_fields[column.name] = (List[field_type.item_type], Field(default_factory=list))
+                column_plan.append((column.name, _handle_array, field_type.item_type))
             case _:  # * Simple type
                 view_query_fields[column.name] = (Optional[field_type], Field(default=None))
                 response_fields[column.name] = (field_type, Field(default=None))
+                column_plan.append((column.name, None, None))  # pass-through
+
+    # * Only plain-typed columns are filterable (JSONB/array filtering is
+    # * still unsupported) — precomputed so the handler never re-derives it
+    filterable_columns = frozenset(name for name, handler, _ in column_plan if handler is None)
 
         # if isinstance(field_type, JSONBType):
         #     # Create dynamic model for JSONB fields
@@ -92,6 +134,21 @@ def generate_view_routes(
         __base__=ViewBase,
         **response_fields
     )
+    # * One compiled validator for the whole list: the response validates in
+    # * a single pydantic-core call instead of one model_validate per row
+    response_adapter = TypeAdapter(List[ViewResponseModel])
+
+    # * Statement memoized per filter-name shape: only the first request with
+    # * a given filter combination pays string assembly and text() parsing;
+    # * values travel as binds, so the cache stays small and injection-safe
+    base_query = f'SELECT * FROM {schema}.{view_table.name}'
+
+    @lru_cache(maxsize=128)
+    def stmt_for(filter_names: tuple):
+        sql = base_query
+        if filter_names:
+            sql += " WHERE " + " AND ".join(f"{name} = :param_{name}" for name in filter_names)
+        return text(sql).execution_options(stream_results=True, yield_per=1000)
 
     @router.get(
         f"/{view_table.name}",
@@ -104,80 +161,43 @@ def generate_view_routes(
         db: Session = Depends(db_dependency),
         filters: ViewQueryParams = Depends(),
     ) -> List[ViewResponseModel]:
-        query_parts = [f'SELECT * FROM {schema}.{view_table.name}']
+        # Handle filters (JSONB/array columns were excluded at generation time).
+        # __pydantic_fields_set__ already holds the explicitly set names, so
+        # there is no model_dump allocation just to iterate them.
         params = {}
+        active_names = []
+        for field_name in filters.__pydantic_fields_set__:
+            if field_name in filterable_columns:
+                value = getattr(filters, field_name)
+                if value is not None:
+                    active_names.append(field_name)
+                    params[f"param_{field_name}"] = value
+
+        # Execute query and process results off the precomputed column plan:
+        # no per-row type resolution, no isinstance dispatch. stream_results
+        # pulls rows through a server-side cursor in 1000-row batches, so the
+        # driver never buffers the full result alongside the processed list.
+        result = db.execute(stmt_for(tuple(sorted(active_names))), params)
 
-        # Handle filters
-        filter_conditions = []
-        for field_name, value in filters.model_dump(exclude_unset=True).items():
-            if value is not None:
-                column = getattr(view_table.c, field_name)
-                if isinstance(get_eq_type(str(column.type)), (JSONBType, ArrayType)):
-                    # Skip JSONB and array filtering for now
-                    continue
-                else:
-                    param_name = f"param_{field_name}"
-                    filter_conditions.append(f"{field_name} = :{param_name}")
-                    params[param_name] = value
-
-        if filter_conditions:
-            query_parts.append("WHERE " + " AND ".join(filter_conditions))
-
-        # Execute query and process results
-        result = db.execute(text(" ".join(query_parts)), params)
-        
         processed_records = []
         for row in result:
-            record_dict = dict(row._mapping)
+            row_mapping = row._mapping
             processed_record = {}
-            
-            for column_name, value in record_dict.items():
-                column = view_table.c[column_name]
-                field_type = get_eq_type(str(column.type), value, nullable=column.nullable)
-
-                if isinstance(field_type, JSONBType):
-                    if value is not None:
-                        # Parse JSONB data
-                        if isinstance(value, str):
-                            json_data = json.loads(value)
-                        else:
-                            json_data = value
-                        processed_record[column_name] = json_data
-                    else:
-                        processed_record[column_name] = None
-                elif isinstance(field_type, ArrayType):
-                    if value is not None:
-                        if isinstance(value, str):
-                            cleaned_value = value.strip('{}').split(',')
-                            processed_record[column_name] = [
-                                field_type.item_type(item.strip('"')) 
-                                for item in cleaned_value 
-                                if item.strip()
-                            ]
-                        elif isinstance(value, list):
-                            processed_record[column_name] = [
-                                field_type.item_type(item) 
-                                for item in value 
-                                if item is not None
-                            ]
-                        else:
-                            processed_record[column_name] = value
-                    else:
-                        processed_record[column_name] = []
-                else:
-                    processed_record[column_name] = value
-            
+            for column_name, handler, item_type in column_plan:
+                value = row_mapping[column_name]
+                processed_record[column_name] = value if handler is None else handler(value, item_type)
             processed_records.append(processed_record)
 
-        # Validate each record
-        validated_records = []
-        for record in processed_records:
-            try:
-                validated_record = ViewResponseModel.model_validate(record)
-                validated_records.append(validated_record)
-            except Exception as e:
-                print(f"Validation error for record: {record}")
-                print(f"Error: {str(e)}")
-                raise
-
-        return validated_records
+        # Validate the batch in one pass; on failure, replay row by row so the
+        # offending record still gets logged before the error propagates
+        try:
+            return response_adapter.validate_python(processed_records)
+        except Exception:
+            for record in processed_records:
+                try:
+                    ViewResponseModel.model_validate(record)
+                except Exception as e:
+                    print(f"Validation error for record: {record}")
+                    print(f"Error: {str(e)}")
+                    raise
+            raise
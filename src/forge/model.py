@@ -3,7 +3,7 @@ ModelForge: Enhanced model management for database entities.
 Handles Pydantic and SQLAlchemy model generation, caching, and type mapping.
 """
 from typing import Dict, List, Optional, Type, Any
-from pydantic import BaseModel, Field, ConfigDict, create_model
+from pydantic import BaseModel, Field, ConfigDict, SkipValidation, create_model
 from sqlalchemy import Column, Table, inspect, Enum as SQLAlchemyEnum
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.ext.declarative import declared_attr
@@ -48,7 +48,8 @@ class ModelForge(BaseModel):
     Manages model generation and caching for database entities.
     Handles both Pydantic and SQLAlchemy models with support for enums.
     """
-    db_manager: DBForge = Field(..., description="Database manager instance")
+    # * SkipValidation: DBForge is a plain dataclass; re-validating it would re-run __post_init__
+    db_manager: SkipValidation[DBForge] = Field(..., description="Database manager instance")
     include_schemas: List[str] = Field(..., description="Schemas to include in model generation")
     exclude_tables: List[str] = Field(default_factory=list)
 
@@ -69,52 +70,49 @@ class ModelForge(BaseModel):
         """Load and cache enum types from database, properly handling views."""
         # First pass: collect all unique enum value sets from base tables
         for schema in self.include_schemas:
-            for table in self.db_manager.metadata.tables.values():
-                if table.name in inspect(self.db_manager.engine).get_table_names(schema=schema):
-                    for column in table.columns:
-                        if isinstance(column.type, SQLAlchemyEnum):
-                            enum_name = f"{column.name}_enum"
-                            if enum_name not in self.enum_cache:
-                                self.enum_cache[enum_name] = EnumInfo(
-                                    name=enum_name,
-                                    values=list(column.type.enums),
-                                    python_enum=PyEnum(enum_name, {v: v for v in column.type.enums})
-                                )
-                                # print(f"\t{bold(enum_name):>32} {gray(column.type):>24} {italic(column.type.enums)}")
+            for table in self.db_manager.get_tables(schema).values():
+                for column in table.columns:
+                    if isinstance(column.type, SQLAlchemyEnum):
+                        enum_name = f"{column.name}_enum"
+                        if enum_name not in self.enum_cache:
+                            self.enum_cache[enum_name] = EnumInfo(
+                                name=enum_name,
+                                values=list(column.type.enums),
+                                python_enum=PyEnum(enum_name, {v: v for v in column.type.enums})
+                            )
+                            # print(f"\t{bold(enum_name):>32} {gray(column.type):>24} {italic(column.type.enums)}")
 
     def _load_models(self) -> None:
         """Generate and register both Pydantic and SQLAlchemy models for a table."""
-        for schema in self.db_manager.metadata._schemas:
-            for table in self.db_manager.metadata.tables.values():
-                if table.name in inspect(self.db_manager.engine).get_table_names(schema=schema):
-                    fields = {}
-                    for column in table.columns:
-                        field_type = get_eq_type(str(column.type))
-                        fields[column.name] = (
-                            Optional[field_type] if column.nullable else field_type,
-                            Field(default=None if column.nullable else ...)
-                        )
-
-                    # * GET THE PYDANTIC MODEL
-                    pydantic_model: Type[BaseModel] = create_model(
-                        f"Pydantic_{table.name}",
-                        __config__=ConfigDict(from_attributes=True),
-                        **fields
-                    )
-                    # * GET THE SQLALCHEMY MODEL
-                    sqlalchemy_model: Type[BaseSQLModel] = type(
-                        f"SQLAlchemy_{table.name.lower()}",
-                        (BaseSQLModel,),
-                        { '__table__': table, '__tablename__': table.name}
+        for schema in self.include_schemas:
+            for table in self.db_manager.get_tables(schema).values():
+                fields = {}
+                for column in table.columns:
+                    field_type = get_eq_type(str(column.type))
+                    fields[column.name] = (
+                        Optional[field_type] if column.nullable else field_type,
+                        Field(default=None if column.nullable else ...)
                     )
-                    self.model_cache[f"{table.schema}.{table.name}"] = pydantic_model, sqlalchemy_model
+
+                # * GET THE PYDANTIC MODEL
+                pydantic_model: Type[BaseModel] = create_model(
+                    f"Pydantic_{table.name}",
+                    __config__=ConfigDict(from_attributes=True),
+                    **fields
+                )
+                # * GET THE SQLALCHEMY MODEL
+                sqlalchemy_model: Type[BaseSQLModel] = type(
+                    f"SQLAlchemy_{table.name.lower()}",
+                    (BaseSQLModel,),
+                    { '__table__': table, '__tablename__': table.name}
+                )
+                self.model_cache[f"{table.schema}.{table.name}"] = pydantic_model, sqlalchemy_model
 
     def _load_views(self) -> None:
         """Load and cache view tables from the database."""
-        for schema in self.db_manager.metadata._schemas:
-            for table in self.db_manager.metadata.tables.values():
-                if table.name in inspect(self.db_manager.engine).get_view_names(schema=schema):
-                    self.view_cache[table.name] = table
+        for schema in self.include_schemas:
+            for view_name, view_table in self.db_manager.get_views(schema).items():
+                self.view_cache[view_name] = view_table
 
     def log_metadata_stats(self) -> None:
         """Print metadata statistics for the database with improved formatting."""
@@ -138,16 +136,14 @@ class ModelForge(BaseModel):
     def log_schema_tables(self) -> None:
         for schema in self.include_schemas:
             print(f"\n{'Schema:'} {bold(schema)}")
-            for table in self.db_manager.metadata.tables.values():
-                if table.name in inspect(self.db_manager.engine).get_table_names(schema=schema):
-                    print_table_structure(table)
+            for table in self.db_manager.get_tables(schema).values():
+                print_table_structure(table)
 
     def log_schema_views(self) -> None:
         for schema in self.include_schemas:
             print(f"\n{'Schema:'} {bold(schema)}")
-            for table in self.db_manager.metadata.tables.values():
-                if table.name in inspect(self.db_manager.engine).get_view_names(schema=schema):
-                    print_table_structure(table)
+            for view_table in self.db_manager.get_views(schema).values():
+                print_table_structure(view_table)
 
 def print_table_structure(table: Table) -> None:
     """Print detailed table structure with columns and enums."""
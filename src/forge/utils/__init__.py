@@ -1,3 +1,5 @@
+import re
+
 from pydantic import BaseModel, Field
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -5,31 +7,42 @@ from forge.utils.sql_types import *
 
 
 # * TEXT FORMATTING
-bold = lambda x: f"\033[1m{x}\033[0m"
-italic = lambda x: f"\033[3m{x}\033[0m"
-underline = lambda x: f"\033[4m{x}\033[0m"
-strike = lambda x: f"\033[9m{x}\033[0m"
-dim = lambda x: f"\033[2m{x}\033[0m"
+# * Each helper closes over its precomposed escape prefix, built once at
+# * import; a call is then a single interpolation instead of also rebuilding
+# * the prefix per invocation.
+_RESET = "\033[0m"
+
+def _styled(prefix: str):
+    return lambda x: f"{prefix}{x}{_RESET}"
+
+bold = _styled("\033[1m")
+italic = _styled("\033[3m")
+underline = _styled("\033[4m")
+strike = _styled("\033[9m")
+dim = _styled("\033[2m")
 # * COLORS
-gray = lambda x: f"\033[90m{x}\033[0m"
-green = lambda x: f"\033[32m{x}\033[0m"
-yellow = lambda x: f"\033[33m{x}\033[0m"
-red = lambda x: f"\033[31m{x}\033[0m"
-blue = lambda x: f"\033[94m{x}\033[0m"
-magenta = lambda x: f"\033[95m{x}\033[0m"
-cyan = lambda x: f"\033[96m{x}\033[0m"
+gray = _styled("\033[90m")
+green = _styled("\033[32m")
+yellow = _styled("\033[33m")
+red = _styled("\033[31m")
+blue = _styled("\033[94m")
+magenta = _styled("\033[95m")
+cyan = _styled("\033[96m")
 # * STYLES
-bright = lambda x: f"\033[1;97m{x}\033[0m"
-header = lambda x: f"\n{bright('='*50)}\n{bright(x)}\n{bright('='*50)}"
+bright = _styled("\033[1;97m")
+_HEADER_BAR = bright('=' * 50)  # * the bar never changes; wrap it once
+header = lambda x: f"\n{_HEADER_BAR}\n{bright(x)}\n{_HEADER_BAR}"
 bullet = lambda x: f"• {x}"
 arrow = lambda x: f"→ {x}"
 box = lambda x: f"┌{'─'*50}┐\n│{x:^50}│\n└{'─'*50}┘"
 
+# * Compiled once: visible_len runs per row in the stats tables, and the
+# * pattern never changes
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 def visible_len(text: str) -> int:
     """Calculate the visible length of a string, ignoring ANSI color codes."""
-    # Remove all ANSI escape sequences
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return len(ansi_escape.sub('', text))
+    return len(_ANSI_RE.sub('', text))
 
 class AppConfig(BaseModel):
     PROJECT_NAME: str = Field(..., description="The name of your project")
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Any, Dict, Type, List, Optional, Union, get_args, get_origin
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
@@ -112,16 +113,30 @@ def make_optional(type_: Type) -> Type:
         case True: return type_
         case _: return Optional[type_]  # Add Optional wrapper
 
-def get_eq_type(sql_type: str, sample_data: Any = None, nullable: bool = True) -> Type:
-    """Enhanced type mapping with JSONB support and nullable handling"""
-    match sql_type.lower():
-        case 'jsonb': return JSONBType(sample_data)
+@lru_cache(maxsize=512)
+def _resolve_eq_type(lowered: str, nullable: bool) -> Type:
+    """Regex-table resolution for one (type string, nullable) pair, memoized.
+
+    A schema only carries a handful of distinct SQL type strings while
+    discovery/route generation resolves thousands of columns and parameters,
+    so each distinct pair pays the pattern scan exactly once.
+    """
+    match lowered:
         case 'timestamp': return make_optional(datetime) if nullable else datetime
-        case _ if sql_type.endswith('[]'):  # Handle array types
-            array_type = parse_array_type(sql_type.lower())
+        case _ if lowered.endswith('[]'):  # Handle array types
+            array_type = parse_array_type(lowered)
             return make_optional(array_type) if nullable else array_type
-        case _:  # * Handle other types (including JSONB)
+        case _:
             for pattern, py_type in SQL_TYPE_MAPPING.items():
-                if re.match(pattern, sql_type.lower()):
+                if re.match(pattern, lowered):
                     return make_optional(py_type) if nullable else py_type
             return Any  # Default fallback
+
+def get_eq_type(sql_type: str, sample_data: Any = None, nullable: bool = True) -> Type:
+    """Enhanced type mapping with JSONB support and nullable handling"""
+    lowered = sql_type.lower()
+    # * JSONB stays outside the cache: sample_data is arbitrary (unhashable)
+    # * and each JSONBType carries its own per-view model cache
+    if lowered == 'jsonb':
+        return JSONBType(sample_data)
+    return _resolve_eq_type(lowered, nullable)